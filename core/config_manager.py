@@ -1,20 +1,88 @@
 """Configuration management for saving and loading setups"""
 
+import copy
+import functools
+import hashlib
 import json
 import os
-from typing import Dict, List, Optional
-from dataclasses import dataclass
+import re
+import sys
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
 
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib json module
+    orjson = None
 
-@dataclass
+
+# Slotted dataclasses need Python 3.10+, older versions use regular ones
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# User-friendly modifier name -> (Tkinter modifier, sort order)
+# Tkinter is sensitive to modifier order, so keep them consistent
+_USER_TO_TK = {
+    "ctrl": ("Control", 0),
+    "alt": ("Alt", 1),
+    "shift": ("Shift", 2),
+    "cmd": ("Command", 3),
+}
+
+# A single comma-separated duration part ("5s", "2.5m", "1h") using the decimal
+# number syntax float() accepts, unit defaults to seconds
+_DURATION_PART_RE = re.compile(r"([+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:e[+-]?\d+)?)\s*([smh]?)")
+_UNIT_SECONDS = {"s": 1.0, "m": 60.0, "h": 3600.0, "": 1.0}
+
+# Tkinter modifier -> user-friendly display name
+_TK_TO_USER = {
+    "Control": "Ctrl",
+    "Alt": "Alt",
+    "Shift": "Shift",
+    "Command": "Cmd",
+}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class KeyConfig:
     """Configuration for a single key"""
     hold: float = 0.1
     repeat: int = 1
     wait: float = 0.0
+    
+    def as_strings(self) -> Tuple[str, str, str]:
+        """Get hold, repeat and wait formatted for display"""
+        return _format_key_values(self.hold, self.repeat, self.wait)
 
 
-@dataclass 
+@functools.lru_cache(maxsize=256)
+def _duration_seconds(display: str) -> Optional[float]:
+    """Parse a display duration once per distinct string, None if it is invalid"""
+    # Validate and sum in a single pass over the comma-separated parts
+    total = 0.0
+    parts = 0
+    for part in display.lower().split(","):
+        part = part.strip()
+        if not part:
+            continue
+        
+        match = _DURATION_PART_RE.fullmatch(part)
+        if match is None:
+            return None
+        
+        total += float(match.group(1)) * _UNIT_SECONDS[match.group(2)]
+        parts += 1
+    
+    return total if parts else None
+
+
+@functools.lru_cache(maxsize=256, typed=True)
+def _format_key_values(hold, repeat, wait) -> Tuple[str, str, str]:
+    """Format key values once per distinct combination"""
+    return str(hold), str(repeat), str(wait)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Setup:
     """Complete setup configuration"""
     name: str
@@ -23,11 +91,7 @@ class Setup:
     interval: float = 5.0
     interval_display: str = "5s"  # User-friendly display format
     keybind: str = "F9"
-    keys: Dict[str, KeyConfig] = None
-    
-    def __post_init__(self):
-        if self.keys is None:
-            self.keys = {}
+    keys: Dict[str, KeyConfig] = field(default_factory=dict)
 
 
 class ConfigManager:
@@ -36,18 +100,61 @@ class ConfigManager:
     def __init__(self, setup_dir: str = "core/setup"):
         self.setup_dir = setup_dir
         os.makedirs(setup_dir, exist_ok=True)
+        
+        # Every setup in the directory, keyed by name, with the file mtime it
+        # was parsed at (None when it still has to be parsed)
+        self._by_name: Dict[str, Tuple[Optional[int], Optional[Setup]]] = {}
+        self._dir_mtime: Optional[int] = None
+        
+        # Hash of the content last written for each setup name, with the
+        # file's mtime and size right after that write
+        self._saved_hash: Dict[str, Tuple[bytes, int, int]] = {}
+        
+        # The directory is scanned lazily by the first list/load/exists call,
+        # which the GUI runs on its config IO worker
+    
+    def _preload_all(self):
+        """Scan the setup directory and parse every setup, if it changed since the last scan"""
+        try:
+            dir_mtime = os.stat(self.setup_dir).st_mtime_ns
+        except FileNotFoundError:
+            self._by_name.clear()
+            self._dir_mtime = None
+            return
+        
+        if dir_mtime == self._dir_mtime:
+            return
+        self._dir_mtime = dir_mtime
+        
+        with os.scandir(self.setup_dir) as entries:
+            # Strip the .json extension from each setup file
+            names = {
+                entry.name[:-5] for entry in entries
+                if entry.name.endswith('.json') and entry.is_file()
+            }
+        
+        for name in list(self._by_name):
+            if name not in names:
+                del self._by_name[name]
+        
+        for name in names:
+            if name not in self._by_name:
+                self._by_name[name] = self._read_entry(name)
+    
+    def _read_entry(self, name: str) -> Tuple[Optional[int], Optional[Setup]]:
+        """Parse a setup file, returning its mtime and Setup (None if unreadable)"""
+        file_path = os.path.join(self.setup_dir, f"{name}.json")
+        try:
+            mtime = os.stat(file_path).st_mtime_ns
+            return mtime, self._read_setup(name, file_path)
+        except Exception as e:
+            print(f"Error loading setup {name}: {e}")
+            return None, None
     
     def list_setups(self) -> List[str]:
         """Get list of available setup names"""
-        setups = []
-        if not os.path.exists(self.setup_dir):
-            return setups
-            
-        for file in os.listdir(self.setup_dir):
-            if file.endswith('.json'):
-                setups.append(file[:-5])  # Remove .json extension
-        
-        return sorted(setups)
+        self._preload_all()
+        return sorted(self._by_name)
     
     def save_setup(self, setup: Setup) -> bool:
         """Save a setup to file"""
@@ -74,10 +181,32 @@ class ConfigManager:
                     "wait": key_config.wait
                 }
             
+            if orjson is not None:
+                content = orjson.dumps(config_data, option=orjson.OPT_INDENT_2)
+            else:
+                content = json.dumps(config_data, indent=2).encode()
+            
+            # Skip the write if this exact content was already saved and the
+            # file hasn't been touched since
             file_path = os.path.join(self.setup_dir, f"{setup.name}.json")
-            with open(file_path, 'w') as f:
-                json.dump(config_data, f, indent=4)
+            content_hash = hashlib.blake2b(content, digest_size=16).digest()
+            saved = self._saved_hash.get(setup.name)
+            if saved is not None and saved[0] == content_hash:
+                try:
+                    stat = os.stat(file_path)
+                    if (stat.st_mtime_ns, stat.st_size) == saved[1:]:
+                        return True
+                except FileNotFoundError:
+                    pass
+            
+            with open(file_path, 'wb') as f:
+                f.write(content)
+            
+            # Reparse on the next load
+            self._by_name[setup.name] = (None, None)
             
+            stat = os.stat(file_path)
+            self._saved_hash[setup.name] = (content_hash, stat.st_mtime_ns, stat.st_size)
             return True
             
         except Exception as e:
@@ -90,107 +219,101 @@ class ConfigManager:
             return tkinter_keybind
         
         parts = tkinter_keybind.split("-")
-        display_parts = []
         
-        for part in parts[:-1]:  # All but the last part are modifiers
-            if part == "Control":
-                display_parts.append("Ctrl")
-            elif part == "Alt":
-                display_parts.append("Alt")
-            elif part == "Shift":
-                display_parts.append("Shift")
-            elif part == "Command":
-                display_parts.append("Cmd")
-            else:
-                display_parts.append(part)
-        
-        # Add the actual key
-        key = parts[-1]
-        display_parts.append(key)
+        # All but the last part are modifiers, the last one is the actual key
+        display_parts = [_TK_TO_USER.get(part, part) for part in parts[:-1]]
+        display_parts.append(parts[-1])
         
         return "+".join(display_parts)
     
     def load_setup(self, name: str) -> Optional[Setup]:
         """Load a setup from file"""
+        self._preload_all()
+        if name not in self._by_name:
+            return None
+        
         try:
             file_path = os.path.join(self.setup_dir, f"{name}.json")
             
-            if not os.path.exists(file_path):
+            try:
+                mtime = os.stat(file_path).st_mtime_ns
+            except FileNotFoundError:
+                del self._by_name[name]
                 return None
             
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-            
-            config = data.get("config", {})
-            process = data.get("process", {})
+            # Reparse only if the file changed since it was last read
+            cached_mtime, setup = self._by_name[name]
+            if setup is None or cached_mtime != mtime:
+                setup = self._read_setup(name, file_path)
+                self._by_name[name] = (mtime, setup)
             
-            interval = config.get("interval", 5.0)
-            # Handle both old (integer only) and new (with display) formats
-            interval_display = config.get("interval_display")
-            if interval_display is None:
-                # Old config - generate display format from seconds
-                interval_display = self.seconds_to_display(interval)
-            
-            # Handle keybind format conversion
-            keybind = config.get("keybind", "F9")
-            # Convert user format (Ctrl+F) to Tkinter format (Control-F)
-            keybind = self.convert_keybind_format(keybind)
-            
-            setup = Setup(
-                name=name,
-                window_id=config.get("window_id", ""),
-                window_title=config.get("window_title", ""),
-                interval=interval,
-                interval_display=interval_display,
-                keybind=keybind
-            )
-            
-            # Convert process data to KeyConfig objects
-            for key, key_data in process.items():
-                setup.keys[key] = KeyConfig(
-                    hold=key_data.get("hold", 0.1),
-                    repeat=key_data.get("repeat", 1),
-                    wait=key_data.get("wait", 0.0)
-                )
-            
-            return setup
+            return copy.deepcopy(setup)
             
         except Exception as e:
             print(f"Error loading setup {name}: {e}")
             return None
     
+    def _read_setup(self, name: str, file_path: str) -> Setup:
+        """Read and parse a setup file"""
+        if orjson is not None:
+            with open(file_path, 'rb') as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(file_path, 'r') as f:
+                data = json.load(f)
+        
+        config = data.get("config", {})
+        process = data.get("process", {})
+        
+        interval = config.get("interval", 5.0)
+        # Handle both old (integer only) and new (with display) formats
+        interval_display = config.get("interval_display")
+        if interval_display is None:
+            # Old config - generate display format from seconds
+            interval_display = self.seconds_to_display(interval)
+        
+        # Handle keybind format conversion
+        keybind = config.get("keybind", "F9")
+        # Convert user format (Ctrl+F) to Tkinter format (Control-F)
+        keybind = self.convert_keybind_format(keybind)
+        
+        setup = Setup(
+            name=name,
+            window_id=config.get("window_id", ""),
+            window_title=config.get("window_title", ""),
+            interval=interval,
+            interval_display=interval_display,
+            keybind=keybind
+        )
+        
+        # Convert process data to KeyConfig objects
+        for key, key_data in process.items():
+            setup.keys[key] = KeyConfig(
+                hold=key_data.get("hold", 0.1),
+                repeat=key_data.get("repeat", 1),
+                wait=key_data.get("wait", 0.0)
+            )
+        
+        return setup
+    
     def convert_keybind_format(self, keybind: str) -> str:
         """Convert user-friendly keybind format to Tkinter format"""
         if "+" not in keybind:
             return keybind
         
         parts = keybind.split("+")
-        tkinter_parts = []
         
-        # Sort modifiers for consistent ordering (Tkinter is sensitive to order)
-        modifier_order = {"Control": 0, "Alt": 1, "Shift": 2, "Command": 3}
         modifiers = []
-        
         for part in parts[:-1]:  # All but the last part are modifiers
             part = part.strip()
-            if part.lower() == "ctrl":
-                modifiers.append(("Control", 0))
-            elif part.lower() == "alt":
-                modifiers.append(("Alt", 1))
-            elif part.lower() == "shift":
-                modifiers.append(("Shift", 2))
-            elif part.lower() == "cmd":
-                modifiers.append(("Command", 3))
-            else:
-                modifiers.append((part.capitalize(), 4))
+            modifiers.append(_USER_TO_TK.get(part.lower()) or (part.capitalize(), 4))
         
         # Sort modifiers by their order priority
-        modifiers.sort(key=lambda x: x[1])
+        modifiers.sort(key=itemgetter(1))
         tkinter_parts = [mod[0] for mod in modifiers]
         
         # Add the actual key
-        key = parts[-1].strip()
-        tkinter_parts.append(key)
+        tkinter_parts.append(parts[-1].strip())
         
         return "-".join(tkinter_parts)
     
@@ -229,46 +352,27 @@ class ConfigManager:
             
             return ",".join(parts)
     
+    def is_valid_duration(self, display: str) -> bool:
+        """Check if display is a valid duration format"""
+        return _duration_seconds(display) is not None
+    
+    def parse_duration(self, display: str) -> Optional[float]:
+        """Convert display format to seconds, or None if it isn't a valid duration"""
+        return _duration_seconds(display)
+    
     def display_to_seconds(self, display: str) -> float:
         """Convert display format to seconds - supports compound formats like 2h,30m,15s"""
-        display = display.strip().lower()
-        
-        # Handle compound formats (comma-separated)
-        if ',' in display:
-            parts = [part.strip() for part in display.split(',')]
-            total_seconds = 0.0
-            
-            for part in parts:
-                if not part:
-                    continue
-                    
-                if part.endswith('s'):
-                    total_seconds += float(part[:-1])
-                elif part.endswith('m'):
-                    total_seconds += float(part[:-1]) * 60
-                elif part.endswith('h'):
-                    total_seconds += float(part[:-1]) * 3600
-                else:
-                    # Assume seconds if no unit
-                    total_seconds += float(part)
-            
-            return total_seconds
-        
-        # Handle single format  
-        if display.endswith('s'):
-            return float(display[:-1])
-        elif display.endswith('m'):
-            return float(display[:-1]) * 60
-        elif display.endswith('h'):
-            return float(display[:-1]) * 3600
-        else:
-            # Assume seconds if no unit
-            return float(display)
+        seconds = _duration_seconds(display)
+        if seconds is None:
+            raise ValueError(f"Invalid duration format: '{display}'")
+        return seconds
     
     def delete_setup(self, name: str) -> bool:
         """Delete a setup file"""
         try:
             file_path = os.path.join(self.setup_dir, f"{name}.json")
+            self._by_name.pop(name, None)
+            self._saved_hash.pop(name, None)
             
             if os.path.exists(file_path):
                 os.remove(file_path)
@@ -282,5 +386,5 @@ class ConfigManager:
     
     def setup_exists(self, name: str) -> bool:
         """Check if a setup exists"""
-        file_path = os.path.join(self.setup_dir, f"{name}.json")
-        return os.path.exists(file_path)
\ No newline at end of file
+        self._preload_all()
+        return name in self._by_name
\ No newline at end of file
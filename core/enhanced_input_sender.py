@@ -1,31 +1,63 @@
 """Enhanced input sender with hold time and repeat functionality"""
 
+import ctypes
 import subprocess
+import threading
 import time
 from typing import List, Dict
 from core.config_manager import KeyConfig
+from core.input_sender import XDOTOOL, _detect_input_backend
 
 
 class EnhancedInputSender:
     """Sends keyboard inputs with advanced timing and repeat controls"""
     
     def __init__(self):
-        self.backend = self._detect_backend()
+        self.xdo, self.ctx = self._load_libxdo()
+        # Serializes libxdo calls with close(), which frees the context
+        self._xdo_lock = threading.Lock()
+        self.backend = "libxdo" if self.xdo is not None else _detect_input_backend()
     
-    def _detect_backend(self) -> str:
-        """Detect which input tool is available"""
+    def _load_libxdo(self):
+        """Load libxdo and create a persistent context, if available"""
         try:
-            subprocess.run(
-                ["xdotool", "version"],
-                capture_output=True,
-                check=True,
-                timeout=2
-            )
-            return "xdotool"
-        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-            pass
+            xdo = ctypes.CDLL("libxdo.so.3")
+        except OSError:
+            return None, None
+        
+        xdo.xdo_new.argtypes = [ctypes.c_char_p]
+        xdo.xdo_new.restype = ctypes.c_void_p
+        xdo.xdo_free.argtypes = [ctypes.c_void_p]
+        xdo.xdo_free.restype = None
+        for name in ("xdo_send_keysequence_window",
+                     "xdo_send_keysequence_window_down",
+                     "xdo_send_keysequence_window_up"):
+            func = getattr(xdo, name)
+            func.argtypes = [ctypes.c_void_p, ctypes.c_ulong, ctypes.c_char_p, ctypes.c_uint]
+            func.restype = ctypes.c_int
         
-        return "none"
+        ctx = xdo.xdo_new(None)
+        if not ctx:
+            # No X display to connect to
+            return None, None
+        
+        return xdo, ctx
+    
+    def close(self):
+        """Release the libxdo context and its X connection, later sends fail"""
+        with self._xdo_lock:
+            if self.ctx is not None:
+                self.xdo.xdo_free(self.ctx)
+                self.xdo, self.ctx = None, None
+            # Matches no backend, so every send returns False
+            self.backend = "closed"
+    
+    def _xdo_send(self, func_name: str, window: int, keystr: bytes) -> int:
+        """Call a libxdo send function, failing once the context has been freed"""
+        with self._xdo_lock:
+            if self.ctx is None:
+                return 1
+            return getattr(self.xdo, func_name)(self.ctx, window, keystr, 0)
     
     def send_keys_with_config(self, window_id: str, key_configs: Dict[str, KeyConfig]) -> bool:
         """
@@ -38,10 +70,27 @@ class EnhancedInputSender:
         Returns:
             True if all keys sent successfully, False otherwise
         """
+        if self.backend == "libxdo":
+            try:
+                for key_name, config in key_configs.items():
+                    if not self._send_single_key_libxdo(window_id, key_name, config):
+                        return False
+                return True
+            except Exception as e:
+                print(f"Error in send_keys_with_config: {e}")
+                return False
+        
         if self.backend != "xdotool":
             return False
         
         try:
+            # Run the whole cycle in one xdotool process
+            try:
+                return self._send_script(window_id, key_configs)
+            except OSError:
+                # The script never started, fall back to sending each key individually
+                pass
+            
             for key_name, config in key_configs.items():
                 success = self._send_single_key_with_config(window_id, key_name, config)
                 if not success:
@@ -53,23 +102,100 @@ class EnhancedInputSender:
             print(f"Error in send_keys_with_config: {e}")
             return False
     
+    def _build_script(self, window_id: str, key_configs: Dict[str, KeyConfig]) -> bytes:
+        """Build an xdotool script that sends every configured key in order"""
+        lines = []
+        for key, config in key_configs.items():
+            # Without a hold time, one key command does all repeats
+            if config.hold == 0:
+                if config.repeat > 0:
+                    lines.append(
+                        f"key --repeat {config.repeat} --repeat-delay {int(config.wait * 1000)}"
+                        f" --window {window_id} {key}"
+                    )
+                continue
+            
+            for repeat in range(config.repeat):
+                lines.append(f"keydown --window {window_id} {key}")
+                
+                # Hold the key
+                if config.hold > 0:
+                    lines.append(f"sleep {config.hold}")
+                
+                lines.append(f"keyup --window {window_id} {key}")
+                
+                # Wait before next repeat
+                if config.wait > 0 and repeat < config.repeat - 1:
+                    lines.append(f"sleep {config.wait}")
+        
+        lines.append("")
+        return "\n".join(lines).encode()
+    
+    def _send_script(self, window_id: str, key_configs: Dict[str, KeyConfig]) -> bool:
+        """
+        Send all keys through a single xdotool process reading commands from stdin
+        
+        A timeout or non-zero exit fails the cycle, since some keys may already
+        have been sent. Raises OSError if xdotool could not be started.
+        """
+        # Allow for the total hold/wait time spent inside xdotool
+        duration = sum(
+            (config.hold + config.wait) * config.repeat
+            for config in key_configs.values()
+        )
+        
+        try:
+            result = subprocess.run(
+                [XDOTOOL, "-"],
+                input=self._build_script(window_id, key_configs),
+                capture_output=True,
+                timeout=duration + 2,
+                close_fds=False
+            )
+            return result.returncode == 0
+        except subprocess.TimeoutExpired:
+            return False
+    
+    def _send_single_key_libxdo(self, window_id: str, key: str, config: KeyConfig) -> bool:
+        """Send a single key through libxdo without spawning a process"""
+        window = int(window_id, 0)
+        keystr = key.encode()
+        
+        for repeat in range(config.repeat):
+            if self._xdo_send("xdo_send_keysequence_window_down", window, keystr) != 0:
+                return False
+            
+            # Hold the key
+            if config.hold > 0:
+                time.sleep(config.hold)
+            
+            self._xdo_send("xdo_send_keysequence_window_up", window, keystr)
+            
+            # Wait before next repeat
+            if config.wait > 0 and repeat < config.repeat - 1:
+                time.sleep(config.wait)
+        
+        return True
+    
     def _send_single_key_with_config(self, window_id: str, key: str, config: KeyConfig) -> bool:
         """Send a single key with its specific configuration"""
         try:
             for repeat in range(config.repeat):
                 # Send key down
                 result_down = subprocess.run(
-                    ["xdotool", "keydown", "--window", window_id, key],
+                    [XDOTOOL, "keydown", "--window", window_id, key],
                     capture_output=True,
-                    timeout=2
+                    timeout=2,
+                    close_fds=False
                 )
                 
                 if result_down.returncode != 0:
                     # Fallback to simple key press
                     result_simple = subprocess.run(
-                        ["xdotool", "key", "--window", window_id, key],
+                        [XDOTOOL, "key", "--window", window_id, key],
                         capture_output=True,
-                        timeout=2
+                        timeout=2,
+                        close_fds=False
                     )
                     
                     if result_simple.returncode != 0:
@@ -86,9 +212,10 @@ class EnhancedInputSender:
                 
                 # Send key up
                 subprocess.run(
-                    ["xdotool", "keyup", "--window", window_id, key],
+                    [XDOTOOL, "keyup", "--window", window_id, key],
                     capture_output=True,
-                    timeout=2
+                    timeout=2,
+                    close_fds=False
                 )
                 
                 # Wait before next repeat
@@ -112,15 +239,26 @@ class EnhancedInputSender:
         Returns:
             True if successful, False otherwise
         """
+        if self.backend == "libxdo":
+            try:
+                window = int(window_id, 0)
+                for key in keys:
+                    if self._xdo_send("xdo_send_keysequence_window", window, key.encode()) != 0:
+                        return False
+                return True
+            except Exception as e:
+                return False
+        
         if self.backend != "xdotool":
             return False
         
         try:
             for key in keys:
                 result = subprocess.run(
-                    ["xdotool", "key", "--window", window_id, key],
+                    [XDOTOOL, "key", "--window", window_id, key],
                     capture_output=True,
-                    timeout=2
+                    timeout=2,
+                    close_fds=False
                 )
                 
                 if result.returncode != 0:
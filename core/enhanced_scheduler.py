@@ -2,9 +2,9 @@
 
 import threading
 import time
-from typing import List, Dict, Optional
+from typing import List
 from core.enhanced_input_sender import EnhancedInputSender
-from core.config_manager import KeyConfig, Setup
+from core.config_manager import Setup
 
 
 class EnhancedScheduler:
@@ -24,6 +24,8 @@ class EnhancedScheduler:
         self.cycle_callback = cycle_callback
         self.running = False
         self.thread = None
+        self._stop_event = threading.Event()
+        self._failure_count = 0
     
     def start(self):
         """Start the scheduler"""
@@ -31,18 +33,22 @@ class EnhancedScheduler:
             return
         
         self.running = True
+        self._stop_event.clear()
         self.thread = threading.Thread(target=self._run, daemon=True)
         self.thread.start()
     
-    def stop(self):
-        """Stop the scheduler"""
+    def stop(self) -> bool:
+        """Stop the scheduler, returning False if its thread didn't finish in time"""
         self.running = False
+        self._stop_event.set()
         if self.thread:
             self.thread.join(timeout=2)
+            return not self.thread.is_alive()
+        return True
     
     def _run(self):
         """Main scheduler loop with advanced configuration"""
-        while self.running:
+        while not self._stop_event.is_set():
             # Send keys using configuration
             if self.setup.keys:
                 success = self.input_sender.send_keys_with_config(
@@ -53,18 +59,18 @@ class EnhancedScheduler:
                 # Fallback for empty configuration
                 success = True
             
+            # Next cycle is due one interval after this one finished sending
+            deadline = time.perf_counter() + self.setup.interval
+            
             if not success:
                 # Only print warning every 10 failures to avoid spam
-                if not hasattr(self, '_failure_count'):
-                    self._failure_count = 0
                 self._failure_count += 1
                 
                 if self._failure_count % 10 == 1:
                     print(f"Warning: Failed to send keys to window {self.setup.window_id} ({self._failure_count} failures)")
             else:
                 # Reset failure count on success and call callback
-                if hasattr(self, '_failure_count'):
-                    self._failure_count = 0
+                self._failure_count = 0
                 
                 # Call the callback function if provided (for UI updates)
                 if self.cycle_callback and self.running:
@@ -73,11 +79,9 @@ class EnhancedScheduler:
                     except Exception as e:
                         print(f"Callback error: {e}")
             
-            # Wait for interval
-            elapsed = 0
-            while elapsed < self.setup.interval and self.running:
-                time.sleep(0.1)
-                elapsed += 0.1
+            # Wait out the rest of the interval (returns early as soon as stop() is called)
+            if self._stop_event.wait(max(0.0, deadline - time.perf_counter())):
+                break
 
 
 class SimpleScheduler:
@@ -91,6 +95,8 @@ class SimpleScheduler:
         self.interval = interval
         self.running = False
         self.thread = None
+        self._stop_event = threading.Event()
+        self._failure_count = 0
     
     def start(self):
         """Start the scheduler"""
@@ -98,32 +104,35 @@ class SimpleScheduler:
             return
         
         self.running = True
+        self._stop_event.clear()
         self.thread = threading.Thread(target=self._run, daemon=True)
         self.thread.start()
     
-    def stop(self):
-        """Stop the scheduler"""
+    def stop(self) -> bool:
+        """Stop the scheduler, returning False if its thread didn't finish in time"""
         self.running = False
+        self._stop_event.set()
         if self.thread:
             self.thread.join(timeout=2)
+            return not self.thread.is_alive()
+        return True
     
     def _run(self):
         """Main scheduler loop"""
-        while self.running:
+        while not self._stop_event.is_set():
             success = self.input_sender.send_keys_simple(self.window_id, self.keys)
             
+            # Next cycle is due one interval after this one finished sending
+            deadline = time.perf_counter() + self.interval
+            
             if not success:
-                if not hasattr(self, '_failure_count'):
-                    self._failure_count = 0
                 self._failure_count += 1
                 
                 if self._failure_count % 10 == 1:
                     print(f"Warning: Failed to send keys to window {self.window_id} ({self._failure_count} failures)")
             else:
-                if hasattr(self, '_failure_count'):
-                    self._failure_count = 0
+                self._failure_count = 0
             
-            elapsed = 0
-            while elapsed < self.interval and self.running:
-                time.sleep(0.1)
-                elapsed += 0.1
\ No newline at end of file
+            # Wait out the rest of the interval (returns early as soon as stop() is called)
+            if self._stop_event.wait(max(0.0, deadline - time.perf_counter())):
+                break
\ No newline at end of file
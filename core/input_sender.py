@@ -1,30 +1,30 @@
 """Input sending functionality for sending keys to specific windows"""
 
+import functools
+import shutil
 import subprocess
 from typing import List
 
+# Full path to xdotool. subprocess only takes the cheaper posix_spawn() path
+# when the executable has an explicit directory and close_fds=False
+XDOTOOL = shutil.which("xdotool") or "xdotool"
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_input_backend() -> str:
+    """Detect which input tool is available (probed once per process)"""
+    # Try xdotool first (most common)
+    if shutil.which("xdotool"):
+        return "xdotool"
+    
+    return "none"
+
 
 class InputSender:
     """Sends keyboard inputs to specific windows"""
     
     def __init__(self):
-        self.backend = self._detect_backend()
-    
-    def _detect_backend(self) -> str:
-        """Detect which input tool is available"""
-        # Try xdotool first (most common)
-        try:
-            subprocess.run(
-                ["xdotool", "version"],
-                capture_output=True,
-                check=True,
-                timeout=2
-            )
-            return "xdotool"
-        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-            pass
-        
-        return "none"
+        self.backend = _detect_input_backend()
     
     def send_keys(self, window_id: str, keys: List[str]) -> bool:
         """
@@ -44,13 +44,31 @@ class InputSender:
     def _send_keys_xdotool(self, window_id: str, keys: List[str]) -> bool:
         """Send keys using xdotool without focusing the window"""
         try:
+            # Send the whole sequence in one xdotool process
+            script = "".join(f"key --window {window_id} {key}\n" for key in keys)
+            try:
+                result = subprocess.run(
+                    [XDOTOOL, "-"],
+                    input=script.encode(),
+                    capture_output=True,
+                    timeout=2,
+                    close_fds=False
+                )
+                # A failed script may have sent some keys already, so don't
+                # replay the sequence key by key
+                return result.returncode == 0
+            except OSError:
+                # The script never started, fall back to one process per key
+                pass
+            
             # Only use background methods that don't steal focus
             for key in keys:
                 # Method 1: Direct key send to window (background only)
                 result1 = subprocess.run(
-                    ["xdotool", "key", "--window", window_id, key],
+                    [XDOTOOL, "key", "--window", window_id, key],
                     capture_output=True,
-                    timeout=2
+                    timeout=2,
+                    close_fds=False
                 )
                 
                 if result1.returncode == 0:
@@ -59,9 +77,10 @@ class InputSender:
                 # Method 2: For single characters, try type (background only)
                 if len(key) == 1 and key.isalnum():
                     result2 = subprocess.run(
-                        ["xdotool", "type", "--window", window_id, key],
+                        [XDOTOOL, "type", "--window", window_id, key],
                         capture_output=True,
-                        timeout=2
+                        timeout=2,
+                        close_fds=False
                     )
                     
                     if result2.returncode == 0:
@@ -25,6 +25,8 @@ class InputScheduler:
         self.interval = interval
         self.running = False
         self.thread = None
+        self._stop_event = threading.Event()
+        self._failure_count = 0
     
     def start(self):
         """Start the scheduler"""
@@ -32,36 +34,38 @@ class InputScheduler:
             return
         
         self.running = True
+        self._stop_event.clear()
         self.thread = threading.Thread(target=self._run, daemon=True)
         self.thread.start()
     
-    def stop(self):
-        """Stop the scheduler"""
+    def stop(self) -> bool:
+        """Stop the scheduler, returning False if its thread didn't finish in time"""
         self.running = False
+        self._stop_event.set()
         if self.thread:
             self.thread.join(timeout=2)
+            return not self.thread.is_alive()
+        return True
     
     def _run(self):
         """Main scheduler loop"""
-        while self.running:
+        while not self._stop_event.is_set():
             # Send keys
             success = self.input_sender.send_keys(self.window_id, self.keys)
             
+            # Next cycle is due one interval after this one finished sending
+            deadline = time.perf_counter() + self.interval
+            
             if not success:
                 # Only print warning every 10 failures to avoid spam
-                if not hasattr(self, '_failure_count'):
-                    self._failure_count = 0
                 self._failure_count += 1
                 
                 if self._failure_count % 10 == 1:  # Print on 1st, 11th, 21st failure, etc.
                     print(f"Warning: Failed to send keys to window {self.window_id} ({self._failure_count} failures)")
             else:
                 # Reset failure count on success
-                if hasattr(self, '_failure_count'):
-                    self._failure_count = 0
+                self._failure_count = 0
             
-            # Wait for interval (check running status frequently for quick stop)
-            elapsed = 0
-            while elapsed < self.interval and self.running:
-                time.sleep(0.1)
-                elapsed += 0.1
+            # Wait out the rest of the interval (returns early as soon as stop() is called)
+            if self._stop_event.wait(max(0.0, deadline - time.perf_counter())):
+                break
@@ -1,51 +1,67 @@
 """Window management functionality for detecting and listing windows"""
 
+import asyncio
+import functools
+import shutil
 import subprocess
+import time
 from typing import List, Dict, Optional
 
+try:
+    from Xlib import X, display as xdisplay, error as xerror
+except ImportError:  # optional, window listing falls back to xdotool
+    xdisplay = None
+
+# Window titles we never want to list
+_IGNORED_TITLE_PREFIXES = ("Desktop",)
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_window_backend() -> str:
+    """Detect which window management tool is available (probed once per process)"""
+    # Try wmctrl first
+    if shutil.which("wmctrl"):
+        return "wmctrl"
+    
+    # Try xdotool
+    if shutil.which("xdotool"):
+        return "xdotool"
+    
+    return "none"
+
 
 class WindowManager:
     """Manages window detection and listing"""
     
     def __init__(self):
-        self.backend = self._detect_backend()
-    
-    def _detect_backend(self) -> str:
-        """Detect which window management tool is available"""
-        # Try wmctrl first
-        try:
-            subprocess.run(
-                ["wmctrl", "-l"],
-                capture_output=True,
-                check=True,
-                timeout=2
-            )
-            return "wmctrl"
-        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-            pass
+        self.backend = _detect_window_backend()
+        self._display = None  # Persistent X connection for python-xlib
         
-        # Try xdotool
-        try:
-            subprocess.run(
-                ["xdotool", "search", "--name", ".*"],
-                capture_output=True,
-                check=True,
-                timeout=2
-            )
-            return "xdotool"
-        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-            pass
-        
-        return "none"
+        # Short-lived cache so rapid refreshes don't re-enumerate windows
+        self._cache = None
+        self._cache_ts = 0.0
+        self._ttl = 0.5
     
     def get_windows(self) -> List[Dict[str, str]]:
         """Get list of all windows with their IDs and titles"""
+        now = time.monotonic()
+        if self._cache is not None and now - self._cache_ts < self._ttl:
+            return list(self._cache)
+        
         if self.backend == "wmctrl":
-            return self._get_windows_wmctrl()
+            windows = self._get_windows_wmctrl()
         elif self.backend == "xdotool":
-            return self._get_windows_xdotool()
+            windows = self._get_windows_xdotool()
         else:
-            return []
+            windows = []
+        
+        self._cache = windows
+        self._cache_ts = now
+        return list(windows)
+    
+    def invalidate(self):
+        """Force the next get_windows() call to re-enumerate windows"""
+        self._cache = None
     
     def _get_windows_wmctrl(self) -> List[Dict[str, str]]:
         """Get windows using wmctrl"""
@@ -59,77 +75,133 @@ class WindowManager:
                 timeout=2
             )
             
-            for line in result.stdout.strip().split('\n'):
-                if not line:
+            for line in result.stdout.splitlines():
+                parts = line.split(None, 4)
+                if len(parts) < 5:
                     continue
                 
-                parts = line.split(None, 4)
-                if len(parts) >= 5:
-                    window_id = parts[0]
-                    window_class = parts[2]
-                    window_title = parts[4]
-                    
-                    # Filter out some common windows we don't want
-                    if window_title and not window_title.startswith('Desktop'):
-                        windows.append({
-                            'id': window_id,
-                            'title': window_title,
-                            'class': window_class
-                        })
+                window_title = parts[4]
+                
+                # Filter out some common windows we don't want
+                if not window_title.startswith(_IGNORED_TITLE_PREFIXES):
+                    windows.append({
+                        'id': parts[0],
+                        'title': window_title,
+                        'class': parts[2]
+                    })
         
         except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
             pass
         
         return windows
     
-    def _get_windows_xdotool(self) -> List[Dict[str, str]]:
-        """Get windows using xdotool"""
-        windows = []
+    def _get_windows_xlib(self) -> Optional[List[Dict[str, str]]]:
+        """Get windows in-process using python-xlib, or None if unavailable"""
+        if xdisplay is None:
+            return None
+        
         try:
-            # Get all window IDs
-            result = subprocess.run(
-                ["xdotool", "search", "--name", ".*"],
-                capture_output=True,
-                text=True,
-                timeout=2
-            )
+            if self._display is None:
+                self._display = xdisplay.Display()
+            d = self._display
             
-            window_ids = result.stdout.strip().split('\n')
+            root = d.screen().root
+            client_list = root.get_full_property(d.intern_atom('_NET_CLIENT_LIST'), X.AnyPropertyType)
+            if client_list is None:
+                return None
             
-            for window_id in window_ids:
-                if not window_id:
-                    continue
+            net_wm_name = d.intern_atom('_NET_WM_NAME')
+            utf8_string = d.intern_atom('UTF8_STRING')
+            
+            windows = []
+            for xid in client_list.value:
+                window = d.create_resource_object('window', xid)
                 
                 try:
-                    # Get window title
-                    title_result = subprocess.run(
-                        ["xdotool", "getwindowname", window_id],
-                        capture_output=True,
-                        text=True,
-                        timeout=1
-                    )
-                    title = title_result.stdout.strip()
+                    # Prefer the UTF-8 EWMH title, fall back to WM_NAME
+                    name_prop = window.get_full_property(net_wm_name, utf8_string)
+                    if name_prop is not None:
+                        title = name_prop.value
+                        if isinstance(title, bytes):
+                            title = title.decode('utf-8', 'replace')
+                    else:
+                        title = window.get_wm_name() or ""
                     
-                    # Get window class
-                    class_result = subprocess.run(
-                        ["xdotool", "getwindowclassname", window_id],
-                        capture_output=True,
-                        text=True,
-                        timeout=1
-                    )
-                    window_class = class_result.stdout.strip()
-                    
-                    if title and not title.startswith('Desktop'):
-                        windows.append({
-                            'id': window_id,
-                            'title': title,
-                            'class': window_class
-                        })
-                
-                except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
+                    wm_class = window.get_wm_class()
+                    window_class = wm_class[1] if wm_class else ""
+                except (xerror.BadWindow, xerror.BadMatch):
+                    # Window closed while listing, skip it
                     continue
+                
+                if title and not title.startswith(_IGNORED_TITLE_PREFIXES):
+                    windows.append({
+                        'id': f"0x{xid:08x}",
+                        'title': title,
+                        'class': window_class
+                    })
+            
+            return windows
         
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
-            pass
+        except (xerror.DisplayError, xerror.ConnectionClosedError, OSError):
+            # Drop the connection so the next call reconnects
+            self._display = None
+            return None
+        except Exception:
+            return None
+    
+    def _get_windows_xdotool(self) -> List[Dict[str, str]]:
+        """Get windows using xdotool"""
+        # Query every window over one X connection when python-xlib is installed
+        windows = self._get_windows_xlib()
+        if windows is not None:
+            return windows
         
-        return windows
+        try:
+            return asyncio.run(self._async_get_windows_xdotool())
+        except (asyncio.TimeoutError, FileNotFoundError):
+            return []
+    
+    async def _async_get_windows_xdotool(self) -> List[Dict[str, str]]:
+        """Get windows using xdotool, querying every window concurrently"""
+        semaphore = asyncio.Semaphore(32)  # Cap concurrent xdotool processes
+        
+        async def run_xdotool(*args: str, timeout: float) -> str:
+            async with semaphore:
+                process = await asyncio.create_subprocess_exec(
+                    "xdotool", *args,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.DEVNULL
+                )
+                try:
+                    stdout, _ = await asyncio.wait_for(process.communicate(), timeout)
+                except asyncio.TimeoutError:
+                    process.kill()
+                    await process.wait()
+                    raise
+            return stdout.decode(errors="replace").strip()
+        
+        async def describe_window(window_id: str) -> Optional[Dict[str, str]]:
+            try:
+                # Get window title and class at the same time
+                title, window_class = await asyncio.gather(
+                    run_xdotool("getwindowname", window_id, timeout=1),
+                    run_xdotool("getwindowclassname", window_id, timeout=1)
+                )
+            except asyncio.TimeoutError:
+                return None
+            
+            if title and not title.startswith(_IGNORED_TITLE_PREFIXES):
+                return {
+                    'id': window_id,
+                    'title': title,
+                    'class': window_class
+                }
+            return None
+        
+        # Get all window IDs
+        window_ids = (await run_xdotool("search", "--name", ".*", timeout=2)).split('\n')
+        
+        results = await asyncio.gather(
+            *(describe_window(window_id) for window_id in window_ids if window_id)
+        )
+        return [window for window in results if window is not None]
@@ -1,24 +1,125 @@
 """Main GUI window"""
 
 import customtkinter as ctk
+import tkinter as tk
+import copy
 from tkinter import messagebox, simpledialog
-from typing import List, Dict
+from typing import Dict
+from dataclasses import dataclass
 import threading
+import functools
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
 import os
 import sys
-from PIL import Image, ImageTk
+from PIL import Image
 from core.window_manager import WindowManager
 from core.enhanced_input_sender import EnhancedInputSender
-from core.enhanced_scheduler import EnhancedScheduler, SimpleScheduler
+from core.enhanced_scheduler import EnhancedScheduler
 from core.config_manager import ConfigManager, Setup, KeyConfig
 
+# Modifier names in the order they appear in a keybind
+_MOD_ORDER = ("Control", "Alt", "Shift", "Command")
+_MOD_MAP = {"ctrl": "Control", "alt": "Alt", "shift": "Shift", "cmd": "Command"}
+# Tk event state bits, already in _MOD_ORDER order. On X11 Cmd is the
+# Super/Win key (Mod4), Lock and NumLock are ignored
+_STATE_MODS = ((0x4, "Control"), (0x8, "Alt"), (0x1, "Shift"), (0x40, "Command"))
+# Event types that Tk would read as "any key" instead of a keysym
+_KEY_EVENT_TYPES = frozenset(("Key", "KeyPress", "KeyRelease"))
+
+# Interval entry texts
+INTERVAL_PLACEHOLDER = "5s, 2m,30s, 1h,15m"
+INTERVAL_EXAMPLES = "5s, 2m,30s, 1h,15m,30s"
+
+# Bind tag for widgets that scroll the keys frame with the mouse wheel
+_WHEEL_TAG = "KeysWheel"
+# How often the Tk thread runs callbacks queued by worker threads, in ms
+_UI_POLL_MS = 50
+
+# Shared fonts
+FONT_XS = ("Helvetica", 10)
+FONT_SM = ("Helvetica", 11)
+FONT_MD = ("Helvetica", 12)
+FONT_LG = ("Helvetica", 14)
+FONT_LG_B = ("Helvetica", 14, "bold")
+FONT_XL_B = ("Helvetica", 16, "bold")
+FONT_TITLE = ("Helvetica", 28, "bold")
+
+# Shared colors
+COLOR_DANGER = "#EF4444"
+COLOR_DANGER_HOVER = "#DC2626"
+COLOR_SUCCESS = "#10B981"
+COLOR_SUCCESS_HOVER = "#059669"
+COLOR_PRIMARY = "#2563EB"
+COLOR_PRIMARY_HOVER = "#1E40AF"
+COLOR_MUTED = "#6B7280"
+COLOR_SUBTLE = "#888888"
+
+
+@dataclass
+class KeyRow:
+    """Widgets making up one key configuration row"""
+    frame: ctk.CTkFrame
+    key_label: ctk.CTkLabel
+    remove_btn: ctk.CTkButton
+    hold_entry: ctk.CTkEntry
+    repeat_entry: ctk.CTkEntry
+    wait_entry: ctk.CTkEntry
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_key_row(hold, repeat, wait):
+    """Convert the texts of a key row to (hold, repeat, wait), defaults for invalid values"""
+    try:
+        return (
+            float(hold) if hold else 0.1,
+            int(repeat) if repeat else 1,
+            float(wait) if wait else 0.0,
+        )
+    except ValueError:
+        return 0.1, 1, 0.0
+
+
+def _section(parent, title):
+    """Pack a titled section frame and return the frame for its controls"""
+    frame = ctk.CTkFrame(parent)
+    frame.pack(fill="x", pady=(0, 15))
+    
+    ctk.CTkLabel(frame, text=title, font=FONT_LG).pack(anchor="w", padx=15, pady=(15, 5))
+    
+    controls = ctk.CTkFrame(frame, fg_color="transparent")
+    controls.pack(fill="x", padx=15, pady=(0, 15))
+    return controls
+
+
+def _labeled_entry(parent, label, width, padx=(0, 20)):
+    """Pack a small label with an entry below it and return the entry"""
+    frame = ctk.CTkFrame(parent, fg_color="transparent")
+    frame.pack(side="left", padx=padx)
+    
+    ctk.CTkLabel(frame, text=label, font=FONT_SM).pack()
+    entry = ctk.CTkEntry(frame, width=width, height=25)
+    entry.pack(pady=(2, 0))
+    return entry
+
 
 class MainWindow(ctk.CTk):
     """Main application window"""
     
-    def __init__(self, start_hidden=False):
+    # Widget styles for the active and inactive states
+    _ACTIVE_STATUS = {"text": "● ACTIVE", "text_color": COLOR_SUCCESS}
+    _INACTIVE_STATUS = {"text": "● INACTIVE", "text_color": COLOR_DANGER}
+    _TOGGLE_ACTIVE = {"fg_color": COLOR_DANGER, "hover_color": COLOR_DANGER_HOVER}
+    _TOGGLE_INACTIVE = {"fg_color": COLOR_PRIMARY, "hover_color": COLOR_PRIMARY_HOVER}
+    
+    def __init__(self, start_hidden=False, defer_setup=False):
         super().__init__()
         
+        # One persistent binding handles the global keybind, whatever it is
+        self._keybind_match = None
+        self.bind_all("<KeyPress>", self._dispatch_global_key)
+        
         # Window configuration
         self.title("SpecifInput - Background Input Sender")
         self.geometry("700x800")
@@ -37,12 +138,58 @@ class MainWindow(ctk.CTk):
         self.config_manager = ConfigManager()
         self.scheduler = None
         
+        # Config file IO runs here, one job at a time, off the Tk thread
+        self._io_executor = ThreadPoolExecutor(max_workers=1)
+        self._refresh_inflight = False
+        
+        # Callbacks from worker threads, run on the Tk thread by _drain_ui_queue.
+        # Polled rather than posted with after(), which isn't safe off the Tk thread
+        self._ui_queue = queue.Queue()
+        self._ui_poll_after_id = self.after(_UI_POLL_MS, self._drain_ui_queue)
+        
         # State variables
         self.is_active = False
         self.selected_window_id = None
         self.current_setup = Setup(name="")
         self.current_keybind = "F9"
         self.run_count = 0
+        self._counter_after_id = None
+        self._last_counter_update = 0.0
+        self._manual_type_after_id = None
+        self._interval_check_after_id = None
+        self._interval_error = None  # Reason shown next to the interval entry
+        self.window_list = []
+        self._window_by_display: Dict[str, dict] = {}  # Dropdown text -> window
+        self._display_by_title: Dict[str, str] = {}  # Window title -> dropdown text
+        
+        # Widgets created by setup_ui and the capture dialog
+        self.toggle_button = None
+        self.add_key_btn = None
+        self.keybind_label = None
+        self.captured_key = None
+        self.display_key = None
+        self.capture_active = False
+        self._active_label = ""
+        self._inactive_label = ""
+        self._capture_window = None
+        self._capture_current_label = None
+        
+        # What the dropdowns were last filled from, to skip redundant refreshes
+        self._setups_dir_mtime = None
+        self._windows_signature = None
+        self._last_setup_values = ()
+        self._last_window_values = ()
+        
+        # The widget tree can be built later, e.g. while a splash is showing
+        self._setup_done = False
+        if not defer_setup:
+            self.finish_setup()
+    
+    def finish_setup(self):
+        """Build the widgets and fill them, unless that already happened"""
+        if self._setup_done:
+            return
+        self._setup_done = True
         
         # Setup UI
         self.setup_ui()
@@ -135,80 +282,43 @@ class MainWindow(ctk.CTk):
         title_label = ctk.CTkLabel(
             main_frame,
             text="SpecifInput",
-            font=("Helvetica", 28, "bold")
+            font=FONT_TITLE
         )
         title_label.pack(pady=(0, 20))
         
         # Setup management section
-        setup_frame = ctk.CTkFrame(main_frame)
-        setup_frame.pack(fill="x", pady=(0, 15))
-        
-        setup_label = ctk.CTkLabel(
-            setup_frame,
-            text="Configuration Setup:",
-            font=("Helvetica", 14)
-        )
-        setup_label.pack(anchor="w", padx=15, pady=(15, 5))
-        
-        setup_controls_frame = ctk.CTkFrame(setup_frame, fg_color="transparent")
-        setup_controls_frame.pack(fill="x", padx=15, pady=(0, 15))
+        setup_controls_frame = _section(main_frame, "Configuration Setup:")
         
         self.setup_dropdown = ctk.CTkComboBox(
             setup_controls_frame,
             values=["No setups found"],
-            font=("Helvetica", 12),
+            font=FONT_MD,
             width=200,
             command=self.on_setup_selected
         )
         self.setup_dropdown.pack(side="left", padx=(0, 10))
         
-        load_btn = ctk.CTkButton(
-            setup_controls_frame,
-            text="Load",
-            command=self.load_setup,
-            width=60,
-            font=("Helvetica", 12)
-        )
-        load_btn.pack(side="left", padx=(0, 5))
-        
-        save_btn = ctk.CTkButton(
-            setup_controls_frame,
-            text="Save",
-            command=self.save_setup,
-            width=60,
-            font=("Helvetica", 12)
-        )
-        save_btn.pack(side="left", padx=(0, 5))
-        
-        delete_btn = ctk.CTkButton(
-            setup_controls_frame,
-            text="Delete",
-            command=self.delete_setup,
-            width=60,
-            font=("Helvetica", 12),
-            fg_color="#EF4444",
-            hover_color="#DC2626"
-        )
-        delete_btn.pack(side="left")
+        for text, command, padx, colors in (
+            ("Load", self.load_setup, (0, 5), {}),
+            ("Save", self.save_setup, (0, 5), {}),
+            ("Delete", self.delete_setup, 0, {"fg_color": COLOR_DANGER, "hover_color": COLOR_DANGER_HOVER}),
+        ):
+            ctk.CTkButton(
+                setup_controls_frame,
+                text=text,
+                command=command,
+                width=60,
+                font=FONT_MD,
+                **colors
+            ).pack(side="left", padx=padx)
         
         # Window selection section
-        window_frame = ctk.CTkFrame(main_frame)
-        window_frame.pack(fill="x", pady=(0, 15))
-        
-        window_label = ctk.CTkLabel(
-            window_frame,
-            text="Target Window:",
-            font=("Helvetica", 14)
-        )
-        window_label.pack(anchor="w", padx=15, pady=(15, 5))
-        
-        window_select_frame = ctk.CTkFrame(window_frame, fg_color="transparent")
-        window_select_frame.pack(fill="x", padx=15, pady=(0, 15))
+        window_select_frame = _section(main_frame, "Target Window:")
         
         self.window_dropdown = ctk.CTkComboBox(
             window_select_frame,
             values=["No windows found"],
-            font=("Helvetica", 12),
+            font=FONT_MD,
             state="readonly",
             width=400
         )
@@ -219,41 +329,35 @@ class MainWindow(ctk.CTk):
             text="↻ Refresh",
             command=self.refresh_windows,
             width=100,
-            font=("Helvetica", 12)
+            font=FONT_MD
         )
         refresh_btn.pack(side="left")
         
         # Main interval section
-        interval_frame = ctk.CTkFrame(main_frame)
-        interval_frame.pack(fill="x", pady=(0, 15))
-        
-        interval_label = ctk.CTkLabel(
-            interval_frame,
-            text="Main Interval (time between full sequences):",
-            font=("Helvetica", 14)
-        )
-        interval_label.pack(anchor="w", padx=15, pady=(15, 5))
-        
-        interval_input_frame = ctk.CTkFrame(interval_frame, fg_color="transparent")
-        interval_input_frame.pack(fill="x", padx=15, pady=(0, 15))
+        interval_input_frame = _section(main_frame, "Main Interval (time between full sequences):")
         
         self.interval_entry = ctk.CTkEntry(
             interval_input_frame,
-            placeholder_text="5s, 2m,30s, 1h,15m",
-            font=("Helvetica", 12),
+            placeholder_text=INTERVAL_PLACEHOLDER,
+            font=FONT_MD,
             height=40,
             width=200
         )
         self.interval_entry.pack(side="left", padx=(0, 10))
         self.interval_entry.insert(0, "5s")
+        self.interval_entry.bind("<FocusOut>", lambda e: self.check_interval_entry())
+        # Clicking the toggle button doesn't take focus, so also check while typing
+        self.interval_entry.bind("<KeyRelease>", self.on_interval_typed)
         
-        interval_help = ctk.CTkLabel(
+        self._interval_border_color = self.interval_entry.cget("border_color")
+        
+        self.interval_help = ctk.CTkLabel(
             interval_input_frame,
-            text="Examples: 5s, 2m,30s, 1h,15m,30s",
-            font=("Helvetica", 11),
-            text_color="#6B7280"
+            text=f"Examples: {INTERVAL_EXAMPLES}",
+            font=FONT_SM,
+            text_color=COLOR_MUTED
         )
-        interval_help.pack(side="left")
+        self.interval_help.pack(side="left")
         
         # Key configuration section
         keys_frame = ctk.CTkFrame(main_frame)
@@ -265,18 +369,18 @@ class MainWindow(ctk.CTk):
         keys_label = ctk.CTkLabel(
             keys_header_frame,
             text="Key Configuration:",
-            font=("Helvetica", 14)
+            font=FONT_LG
         )
         keys_label.pack(side="left")
         
-        add_key_btn = ctk.CTkButton(
+        self.add_key_btn = ctk.CTkButton(
             keys_header_frame,
             text="+ Add Key",
             command=self.add_key,
             width=100,
-            font=("Helvetica", 12)
+            font=FONT_MD
         )
-        add_key_btn.pack(side="right")
+        self.add_key_btn.pack(side="right")
         
         # Scrollable frame for key configurations with mouse wheel support
         self.keys_scroll_frame = ctk.CTkScrollableFrame(
@@ -290,6 +394,10 @@ class MainWindow(ctk.CTk):
         self.setup_mouse_wheel_scrolling()
         
         self.key_widgets = {}  # Store references to key configuration widgets
+        self._key_rows = {}  # Visible KeyRow for each configured key
+        self._key_row_pool = []  # Hidden KeyRows ready for reuse
+        self._all_key_widgets = []  # Entries of every visible row, for state changes
+        self._keys_placeholder = None
         
         # Status and control section
         control_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
@@ -302,16 +410,16 @@ class MainWindow(ctk.CTk):
         self.status_main_label = ctk.CTkLabel(
             self.status_frame,
             text="● INACTIVE",
-            font=("Helvetica", 16, "bold"),
-            text_color="#EF4444"
+            font=FONT_XL_B,
+            text_color=COLOR_DANGER
         )
         self.status_main_label.pack(side="left")
         
         self.status_counter_label = ctk.CTkLabel(
             self.status_frame,
             text="",
-            font=("Helvetica", 12),
-            text_color="#888888"
+            font=FONT_MD,
+            text_color=COLOR_SUBTLE
         )
         self.status_counter_label.pack(side="left", padx=(5, 0))
         
@@ -320,10 +428,10 @@ class MainWindow(ctk.CTk):
             control_frame,
             text=f"ACTIVATE ({self.current_keybind})",
             command=self.toggle_active,
-            font=("Helvetica", 14, "bold"),
+            font=FONT_LG_B,
             height=50,
-            fg_color="#2563EB",
-            hover_color="#1E40AF"
+            fg_color=COLOR_PRIMARY,
+            hover_color=COLOR_PRIMARY_HOVER
         )
         self.toggle_button.pack(fill="x")
         
@@ -334,129 +442,146 @@ class MainWindow(ctk.CTk):
         self.keybind_label = ctk.CTkLabel(
             control_frame,
             text=f"Press {self.current_keybind} to toggle from anywhere • Right-click button to change",
-            font=("Helvetica", 11),
-            text_color="#6B7280"
+            font=FONT_SM,
+            text_color=COLOR_MUTED
         )
         self.keybind_label.pack(pady=(10, 0))
     
     def setup_mouse_wheel_scrolling(self):
         """Setup mouse wheel scrolling for the keys scroll frame"""
-        def _on_mouse_wheel(event):
-            # Calculate scroll amount (negative for natural scrolling)
-            delta = -1 * (event.delta / 120) if event.delta else (-1 if event.num == 5 else 1)
-            
-            # Try different methods to scroll the CustomTkinter ScrollableFrame
-            try:
-                # Method 1: Try to access the internal canvas
-                if hasattr(self.keys_scroll_frame, '_parent_canvas'):
-                    self.keys_scroll_frame._parent_canvas.yview_scroll(int(delta), "units")
-                elif hasattr(self.keys_scroll_frame, '_scrollable_frame'):
-                    # Try to find canvas in scrollable frame
-                    canvas = None
-                    for child in self.keys_scroll_frame.winfo_children():
-                        if 'canvas' in str(type(child)).lower():
-                            canvas = child
-                            break
-                    if canvas:
-                        canvas.yview_scroll(int(delta), "units")
-                else:
-                    # Method 2: Try using the frame's master canvas
-                    parent = self.keys_scroll_frame.winfo_parent()
-                    if parent:
-                        master = self.keys_scroll_frame._nametowidget(parent)
-                        if hasattr(master, 'yview_scroll'):
-                            master.yview_scroll(int(delta), "units")
-            except Exception as e:
-                print(f"Mouse wheel scroll error: {e}")
-        
-        def _bind_mousewheel(event):
-            # Bind mouse wheel events
-            self.bind_all("<MouseWheel>", _on_mouse_wheel)  # Windows/Mac
-            self.bind_all("<Button-4>", _on_mouse_wheel)    # Linux scroll up
-            self.bind_all("<Button-5>", _on_mouse_wheel)    # Linux scroll down
-        
-        def _unbind_mousewheel(event):
-            # Unbind mouse wheel events
-            self.unbind_all("<MouseWheel>")
-            self.unbind_all("<Button-4>")
-            self.unbind_all("<Button-5>")
-        
-        # Bind on hover
-        self.keys_scroll_frame.bind("<Enter>", _bind_mousewheel)
-        self.keys_scroll_frame.bind("<Leave>", _unbind_mousewheel)
+        # The canvas behind the CTkScrollableFrame never changes, resolve it once
+        self._scroll_canvas = self._resolve_scroll_canvas()
+        
+        # Wheel deltas are accumulated and applied in one scroll per idle pass
+        self._scroll_accum = 0.0
+        self._scroll_pending = False
+        
+        # Drop CustomTkinter's app-wide wheel handler, which climbs the
+        # widget tree on every event (and would scroll a second time)
+        self.unbind_all("<MouseWheel>")
+        
+        # Only widgets tagged with _WHEEL_TAG scroll the frame, so events
+        # fire just over the scrollable area
+        self.bind_class(_WHEEL_TAG, "<MouseWheel>", self._on_mouse_wheel, add="+")  # Windows/Mac
+        self.bind_class(_WHEEL_TAG, "<Button-4>", self._on_mouse_wheel, add="+")    # Linux scroll up
+        self.bind_class(_WHEEL_TAG, "<Button-5>", self._on_mouse_wheel, add="+")    # Linux scroll down
+        
+        if self._scroll_canvas is not None:
+            self._add_wheel_tag(self._scroll_canvas)
+        self._add_wheel_tag(self.keys_scroll_frame)
     
-    def bind_mouse_wheel(self, widget):
-        """Enable mouse wheel scrolling for a scrollable widget"""
-        def _on_mouse_wheel(event):
-            # For CustomTkinter ScrollableFrame, we need to access the canvas differently
-            if hasattr(widget, '_parent_canvas'):
-                widget._parent_canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-            elif hasattr(widget, 'canvas'):  # Try alternative canvas attribute
-                widget.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-            else:
-                # Fallback for different CustomTkinter versions
-                try:
-                    # Try to find the canvas widget within the scrollable frame
-                    for child in widget.winfo_children():
-                        if str(child).endswith('.!canvas'):
-                            child.yview_scroll(int(-1 * (event.delta / 120)), "units")
-                            break
-                except:
-                    pass
-        
-        def _bind_to_mousewheel(event):
-            self.bind_all("<MouseWheel>", _on_mouse_wheel)
-            # Also bind Button-4 and Button-5 for Linux trackpads/mice
-            self.bind_all("<Button-4>", lambda e: _on_mouse_wheel(type('MockEvent', (), {'delta': 120})()))
-            self.bind_all("<Button-5>", lambda e: _on_mouse_wheel(type('MockEvent', (), {'delta': -120})()))
-        
-        def _unbind_from_mousewheel(event):
-            self.unbind_all("<MouseWheel>")
-            self.unbind_all("<Button-4>")
-            self.unbind_all("<Button-5>")
-        
-        # Bind mouse wheel events when hovering over the scrollable frame
-        widget.bind('<Enter>', _bind_to_mousewheel)
-        widget.bind('<Leave>', _unbind_from_mousewheel)
-        
-        # Also bind to all children of the scrollable frame
-        def bind_children(parent):
-            for child in parent.winfo_children():
-                try:
-                    child.bind('<Enter>', _bind_to_mousewheel)
-                    child.bind('<Leave>', _unbind_from_mousewheel)
-                    bind_children(child)  # Recursively bind to grandchildren
-                except:
-                    pass
-        
-        # Delay binding to children until after they're created
-        widget.after(100, lambda: bind_children(widget))
+    def _add_wheel_tag(self, widget):
+        """Let a widget and its children scroll the keys frame with the mouse wheel"""
+        tags = widget.bindtags()
+        if _WHEEL_TAG not in tags:
+            widget.bindtags(tags[:1] + (_WHEEL_TAG,) + tags[1:])
+        
+        for child in widget.winfo_children():
+            self._add_wheel_tag(child)
+    
+    def _on_mouse_wheel(self, event):
+        """Queue a mouse wheel event for the keys scroll frame"""
+        # Calculate scroll amount (negative for natural scrolling)
+        delta = -1 * (event.delta / 120) if event.delta else (-1 if event.num == 5 else 1)
+        
+        self._scroll_accum += delta
+        if not self._scroll_pending:
+            self._scroll_pending = True
+            self.after_idle(self._flush_scroll)
+    
+    def _flush_scroll(self):
+        """Apply the accumulated mouse wheel delta as a single scroll"""
+        # Keep any fractional remainder for the next gesture
+        units = int(self._scroll_accum)
+        self._scroll_accum -= units
+        self._scroll_pending = False
+        
+        # Clamp so a fast wheel spin doesn't jump several screens at once
+        units = max(-3, min(3, units))
+        if not units:
+            return
+        
+        if self._scroll_canvas is not None:
+            self._scroll_canvas.yview_scroll(units, "units")
+    
+    def _resolve_scroll_canvas(self):
+        """Find the canvas widget that scrolls the keys scroll frame"""
+        frame = self.keys_scroll_frame
+        
+        # Method 1: CustomTkinter's internal canvas
+        canvas = getattr(frame, '_parent_canvas', None)
+        if canvas is not None:
+            return canvas
+        
+        # Method 2: A canvas among the frame's children
+        for child in frame.winfo_children():
+            if isinstance(child, tk.Canvas):
+                return child
+        
+        # Method 3: The frame's master, if it can scroll
+        parent = frame.winfo_parent()
+        if parent:
+            master = frame._nametowidget(parent)
+            if hasattr(master, 'yview_scroll'):
+                return master
+        
+        return None
     
     def update_keybind(self):
         """Update the global keybind"""
-        # Clear all existing keybinds first
+        # Matched by _dispatch_global_key, no rebinding needed
         try:
-            self.unbind_all(f"<{self.current_keybind}>")
-        except:
-            pass
-        
-        # Set the new keybind
-        self.bind_all(f"<{self.current_keybind}>", lambda e: self.toggle_active())
+            self._keybind_match = self._parse_keybind(self.current_keybind)
+        except ValueError as e:
+            print(f"Error setting keybind: {e}")
+            self._keybind_match = None
         
-        # Create display format (user-friendly)
-        display_format = self.current_keybind.replace("-", "+").lower()
-        display_format = display_format.replace("control", "ctrl")
+        # Build the button labels once per keybind
+        display_format = self._display_for(self.current_keybind)
+        self._active_label = f"DEACTIVATE ({display_format})"
+        self._inactive_label = f"ACTIVATE ({display_format})"
         
         # Update UI elements
-        if hasattr(self, 'toggle_button'):
-            if self.is_active:
-                self.toggle_button.configure(text=f"DEACTIVATE ({display_format})")
-            else:
-                self.toggle_button.configure(text=f"ACTIVATE ({display_format})")
+        if self.toggle_button is not None:
+            self.toggle_button.configure(text=self._active_label if self.is_active else self._inactive_label)
         
-        if hasattr(self, 'keybind_label'):
+        if self.keybind_label is not None:
             self.keybind_label.configure(text=f"Press {display_format} to toggle from anywhere • Right-click button to change")
     
+    def _dispatch_global_key(self, event):
+        """Toggle the input sender when the global keybind is pressed"""
+        if self.capture_active:
+            # The key is being captured as a new keybind
+            return
+        
+        if self._keybind_match is None:
+            return
+        
+        # Extra modifiers still toggle, like a plain <F9> binding
+        required_mods, required_key = self._keybind_match
+        key = event.keysym.lower() if len(event.keysym) == 1 else event.keysym
+        if key != required_key:
+            return
+        
+        mods = frozenset(mod for bit, mod in _STATE_MODS if event.state & bit)
+        if required_mods <= mods:
+            self.toggle_active()
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _parse_keybind(keybind):
+        """Split Tkinter format (Control-Shift-f) into (modifiers, key) as seen on key events"""
+        *mods, key = keybind.split("-")
+        if not key or key in _KEY_EVENT_TYPES or not set(mods).issubset(_MOD_ORDER):
+            raise ValueError(f"Invalid keybind: '{keybind}'")
+        return frozenset(mods), key.lower() if len(key) == 1 else key
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _display_for(keybind):
+        """Convert Tkinter format (Control-Shift-f) to display format (ctrl+shift+f)"""
+        return keybind.replace("-", "+").lower().replace("control", "ctrl")
+    
     def change_keybind(self, event=None):
         """Handle right-click on toggle button to change keybind"""
         if self.is_active:
@@ -468,12 +593,10 @@ class MainWindow(ctk.CTk):
     
     def capture_keybind(self):
         """Capture a new keybind by listening for keypresses"""
-        # Create capture window
-        capture_window = ctk.CTkToplevel(self)
-        capture_window.title("Capture Keybind")
-        capture_window.geometry("400x250")
-        capture_window.resizable(False, False)
-        capture_window.transient(self)
+        # Build the capture window once, later captures reuse it
+        if self._capture_window is None:
+            self._build_capture_window()
+        capture_window = self._capture_window
         
         # Center the window
         capture_window.geometry("+%d+%d" % (
@@ -483,30 +606,61 @@ class MainWindow(ctk.CTk):
         
         # Variables for key capture
         self.captured_key = None
+        self.display_key = None
         self.capture_active = True
         
+        # Reset what the previous capture left behind
+        if self._manual_type_after_id is not None:
+            self.after_cancel(self._manual_type_after_id)
+            self._manual_type_after_id = None
+        self._capture_current_label.configure(text=f"Current: {self.current_keybind}")
+        self.capture_display.configure(text="Listening for keypress...", text_color=COLOR_PRIMARY)
+        self.manual_entry.delete(0, "end")
+        
+        capture_window.deiconify()
+        
+        # Make sure window is visible before setting up focus and grab
+        capture_window.update_idletasks()
+        
+        # Now set focus and grab
+        capture_window.lift()
+        capture_window.focus_set()
+        
+        # Use after() to delay grab_set until window is fully rendered
+        capture_window.after(100, lambda: capture_window.grab_set() if self.capture_active else None)
+    
+    def _build_capture_window(self):
+        """Create the (hidden) keybind capture window"""
+        # Create capture window
+        capture_window = ctk.CTkToplevel(self)
+        capture_window.withdraw()
+        capture_window.title("Capture Keybind")
+        capture_window.geometry("400x250")
+        capture_window.resizable(False, False)
+        capture_window.transient(self)
+        
         # UI elements
         title_label = ctk.CTkLabel(
             capture_window,
             text="Press the key combination you want to use",
-            font=("Helvetica", 16, "bold")
+            font=FONT_XL_B
         )
         title_label.pack(pady=(20, 10))
         
-        current_label = ctk.CTkLabel(
+        self._capture_current_label = ctk.CTkLabel(
             capture_window,
-            text=f"Current: {self.current_keybind}",
-            font=("Helvetica", 12),
-            text_color="#6B7280"
+            text="",
+            font=FONT_MD,
+            text_color=COLOR_MUTED
         )
-        current_label.pack(pady=(0, 20))
+        self._capture_current_label.pack(pady=(0, 20))
         
         # Captured key display
         self.capture_display = ctk.CTkLabel(
             capture_window,
             text="Listening for keypress...",
-            font=("Helvetica", 14),
-            text_color="#2563EB",
+            font=FONT_LG,
+            text_color=COLOR_PRIMARY,
             width=300,
             height=40
         )
@@ -516,8 +670,8 @@ class MainWindow(ctk.CTk):
         type_label = ctk.CTkLabel(
             capture_window,
             text="Or type manually (F9, ctrl+f, alt+g, etc.):",
-            font=("Helvetica", 11),
-            text_color="#6B7280"
+            font=FONT_SM,
+            text_color=COLOR_MUTED
         )
         type_label.pack(pady=(10, 5))
         
@@ -539,8 +693,8 @@ class MainWindow(ctk.CTk):
             text="Confirm",
             command=lambda: self.confirm_captured_keybind(capture_window),
             width=80,
-            fg_color="#10B981",
-            hover_color="#059669"
+            fg_color=COLOR_SUCCESS,
+            hover_color=COLOR_SUCCESS_HOVER
         )
         confirm_btn.pack(side="left", padx=(0, 10))
         
@@ -549,26 +703,24 @@ class MainWindow(ctk.CTk):
             text="Cancel",
             command=lambda: self.cancel_capture(capture_window),
             width=80,
-            fg_color="#EF4444",
-            hover_color="#DC2626"
+            fg_color=COLOR_DANGER,
+            hover_color=COLOR_DANGER_HOVER
         )
         cancel_btn.pack(side="left")
         
         # Handle window close event
         capture_window.protocol("WM_DELETE_WINDOW", lambda: self.on_capture_window_close(capture_window))
         
-        # Make sure window is visible before setting up focus and grab
-        capture_window.update_idletasks()
-        
-        # Now set focus and grab
-        capture_window.lift()
-        capture_window.focus_set()
-        
-        # Bind key events after window is ready
+        # Bind key events
         capture_window.bind("<KeyPress>", self.on_key_capture)
         
-        # Use after() to delay grab_set until window is fully rendered
-        capture_window.after(100, lambda: capture_window.grab_set())
+        self._capture_window = capture_window
+    
+    def _hide_capture_window(self, capture_window):
+        """End the capture and hide the capture window for reuse"""
+        self.capture_active = False
+        capture_window.grab_release()
+        capture_window.withdraw()
     
     def on_key_capture(self, event):
         """Handle captured keypress"""
@@ -576,16 +728,7 @@ class MainWindow(ctk.CTk):
             return
         
         # Build the key combination with proper modifier ordering
-        modifiers = []
-        if event.state & 0x4:  # Control
-            modifiers.append(("Control", 0))
-        if event.state & 0x8:  # Alt
-            modifiers.append(("Alt", 1))
-        if event.state & 0x1:  # Shift
-            modifiers.append(("Shift", 2))
-        
-        # Sort modifiers by priority for consistency
-        modifiers.sort(key=lambda x: x[1])
+        modifiers = [mod for bit, mod in _STATE_MODS if event.state & bit]
         
         key = event.keysym
         
@@ -608,10 +751,9 @@ class MainWindow(ctk.CTk):
         
         # Combine modifiers and key using Tkinter format
         if modifiers:
-            tkinter_modifiers = [mod[0] for mod in modifiers]
-            self.captured_key = "-".join(tkinter_modifiers) + "-" + captured
+            self.captured_key = "-".join(modifiers) + "-" + captured
             # Also store user-friendly format for display
-            display_modifiers = [mod[0].lower().replace("control", "ctrl") for mod in modifiers]
+            display_modifiers = [mod.lower().replace("control", "ctrl") for mod in modifiers]
             self.display_key = "+".join(display_modifiers) + "+" + captured.lower()
         else:
             self.captured_key = captured
@@ -620,7 +762,7 @@ class MainWindow(ctk.CTk):
         # Update display
         self.capture_display.configure(
             text=f"Captured: {self.display_key}",
-            text_color="#10B981"
+            text_color=COLOR_SUCCESS
         )
         
         # Also update manual entry
@@ -628,7 +770,24 @@ class MainWindow(ctk.CTk):
         self.manual_entry.insert(0, self.display_key)
     
     def on_manual_type(self, event):
-        """Handle manual typing in the entry"""
+        """Handle manual typing in the entry, once the user pauses typing"""
+        if self._manual_type_after_id is not None:
+            self.after_cancel(self._manual_type_after_id)
+        self._manual_type_after_id = self.after(120, self._do_manual_convert)
+    
+    def _flush_manual_type(self):
+        """Apply pending manual typing right away"""
+        if self._manual_type_after_id is not None:
+            self.after_cancel(self._manual_type_after_id)
+            self._do_manual_convert()
+    
+    def _do_manual_convert(self):
+        """Convert the manually typed keybind"""
+        self._manual_type_after_id = None
+        if not self.capture_active:
+            # Capture window already closed
+            return
+        
         typed_key = self.manual_entry.get().strip()
         if typed_key:
             # Convert user-friendly format to Tkinter format
@@ -636,41 +795,36 @@ class MainWindow(ctk.CTk):
             self.captured_key = self.convert_to_tkinter_format(typed_key)
             self.capture_display.configure(
                 text=f"Typed: {typed_key}",
-                text_color="#10B981"
+                text_color=COLOR_SUCCESS
             )
         else:
             self.captured_key = None
             self.display_key = None
             self.capture_display.configure(
                 text="Listening for keypress...",
-                text_color="#2563EB"
+                text_color=COLOR_PRIMARY
             )
     
-    def convert_to_tkinter_format(self, user_format):
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def convert_to_tkinter_format(user_format):
         """Convert user-friendly format (ctrl+shift+f) to Tkinter format (Control-Shift-f)"""
         if "+" not in user_format:
             return user_format
         
         parts = user_format.split("+")
-        modifiers = []
+        modifiers = set()
+        unknown = []
         
-        # Sort modifiers for consistent ordering
         for part in parts[:-1]:  # All but the last part are modifiers
             part = part.strip().lower()
-            if part == "ctrl":
-                modifiers.append(("Control", 0))
-            elif part == "alt":
-                modifiers.append(("Alt", 1))
-            elif part == "shift":
-                modifiers.append(("Shift", 2))
-            elif part == "cmd":
-                modifiers.append(("Command", 3))
+            if part in _MOD_MAP:
+                modifiers.add(_MOD_MAP[part])
             else:
-                modifiers.append((part.capitalize(), 4))
+                unknown.append(part.capitalize())
         
-        # Sort modifiers by priority
-        modifiers.sort(key=lambda x: x[1])
-        tkinter_parts = [mod[0] for mod in modifiers]
+        # Known modifiers in fixed order, unknown ones after them
+        tkinter_parts = [mod for mod in _MOD_ORDER if mod in modifiers] + unknown
         
         # Add the actual key
         key = parts[-1].strip()
@@ -680,31 +834,29 @@ class MainWindow(ctk.CTk):
     
     def confirm_captured_keybind(self, capture_window):
         """Confirm and apply the captured keybind"""
+        self._flush_manual_type()
+        
         if not self.captured_key:
             messagebox.showerror("No Key", "Please press a key combination or type one manually")
             return
         
         if self.captured_key == self.current_keybind:
             # No change needed
-            self.capture_active = False
-            capture_window.destroy()
+            self._hide_capture_window(capture_window)
             return
         
         try:
             # Test the keybind
-            test_key = f"<{self.captured_key}>"
-            self.bind_all(test_key, lambda e: None)
-            self.unbind_all(test_key)
+            self._parse_keybind(self.captured_key)
             
             # Apply the new keybind
             self.current_keybind = self.captured_key
             self.update_keybind()
             
-            self.capture_active = False
-            capture_window.destroy()
+            self._hide_capture_window(capture_window)
             
             # Use display format for success message
-            display_format = getattr(self, 'display_key', self.captured_key)
+            display_format = self.display_key or self.captured_key
             messagebox.showinfo("Success", f"Keybind changed to: {display_format}")
             
         except Exception as e:
@@ -712,6 +864,8 @@ class MainWindow(ctk.CTk):
     
     def on_capture_window_close(self, capture_window):
         """Handle window close - auto-apply if keybind changed"""
+        self._flush_manual_type()
+        
         if self.captured_key and self.captured_key != self.current_keybind:
             # Ask user if they want to apply the change
             result = messagebox.askyesno(
@@ -723,16 +877,13 @@ class MainWindow(ctk.CTk):
             if result:
                 try:
                     # Test the keybind
-                    test_key = f"<{self.captured_key}>"
-                    self.bind_all(test_key, lambda e: None)
-                    self.unbind_all(test_key)
+                    self._parse_keybind(self.captured_key)
                     
                     # Apply the new keybind
                     self.current_keybind = self.captured_key
                     self.update_keybind()
                     
-                    self.capture_active = False
-                    capture_window.destroy()
+                    self._hide_capture_window(capture_window)
                     messagebox.showinfo("Success", f"Keybind changed to: {self.captured_key}")
                     return
                     
@@ -748,34 +899,102 @@ class MainWindow(ctk.CTk):
     
     def cancel_capture(self, capture_window):
         """Cancel keybind capture"""
-        self.capture_active = False
-        capture_window.destroy()
+        self._hide_capture_window(capture_window)
     
     def refresh_setups(self):
         """Refresh the list of available setups"""
-        setups = self.config_manager.list_setups()
+        # Only rescan when setups were added or removed since the last refresh
+        try:
+            dir_mtime = os.stat(self.config_manager.setup_dir).st_mtime_ns
+        except OSError:
+            dir_mtime = None
         
-        if setups:
-            self.setup_dropdown.configure(values=setups)
-            if setups:
-                self.setup_dropdown.set("")  # Clear to allow typing new names
-        else:
-            self.setup_dropdown.configure(values=["No setups found"])
-            self.setup_dropdown.set("")
+        if (dir_mtime is None or dir_mtime != self._setups_dir_mtime) and not self._refresh_inflight:
+            self._setups_dir_mtime = dir_mtime
+            self._refresh_inflight = True
+            self._run_config_io(self.config_manager.list_setups, self._on_setups_listed)
+        
+        if self.setup_dropdown.get():
+            self.setup_dropdown.set("")  # Clear to allow typing new names
+    
+    def _on_setups_listed(self, setups):
+        """Fill the setup dropdown once the setups were listed"""
+        self._refresh_inflight = False
+        if setups is None:
+            # Listing failed, try again on the next refresh
+            self._setups_dir_mtime = None
+            return
+        self._last_setup_values = self._set_dropdown_values(
+            self.setup_dropdown, self._last_setup_values, setups or ["No setups found"]
+        )
+    
+    def _set_dropdown_values(self, dropdown, shown, values):
+        """Configure dropdown values unless they match the shown ones; returns the new shown values"""
+        values = tuple(values)
+        if values != shown:
+            dropdown.configure(values=list(values))
+        return values
+    
+    def _run_config_io(self, work, done):
+        """Run config file work off the Tk thread and pass its result to done on the Tk thread"""
+        def deliver(future):
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"Error in config IO: {e}")
+                result = None
+            
+            self._ui(done, result)
+        
+        self._io_executor.submit(work).add_done_callback(deliver)
+    
+    def _ui(self, fn, *args):
+        """Run fn on the Tk thread; called from other threads it is queued instead"""
+        if threading.current_thread() is threading.main_thread():
+            fn(*args)
+            return
+        
+        self._ui_queue.put((fn, args))
+    
+    def _drain_ui_queue(self):
+        """Run the callbacks queued by other threads"""
+        # Reschedule first, so a failing callback doesn't stop the polling
+        self._ui_poll_after_id = self.after(_UI_POLL_MS, self._drain_ui_queue)
+        while True:
+            try:
+                fn, args = self._ui_queue.get_nowait()
+            except queue.Empty:
+                return
+            fn(*args)
     
     def refresh_windows(self):
         """Refresh the list of available windows"""
         windows = self.window_manager.get_windows()
         
+        # Keep the current list (and selection) if no window changed
+        signature = tuple((w['id'], w['title'], w['class']) for w in windows)
+        if signature == self._windows_signature:
+            return
+        self._windows_signature = signature
+        
+        self.window_list = windows
+        self._window_by_display = {}
+        self._display_by_title = {}
         if windows:
-            window_names = [f"{w['title']} ({w['class']})" for w in windows]
-            self.window_dropdown.configure(values=window_names)
-            self.window_dropdown.set(window_names[0])
-            self.window_list = windows
+            # Interned so dropdown lookups hit the identity fast path
+            window_names = [sys.intern(f"{w['title']} ({w['class']})") for w in windows]
+            # The first window wins when several share a name or title
+            for name, window in zip(window_names, windows):
+                self._window_by_display.setdefault(name, window)
+                self._display_by_title.setdefault(window['title'], name)
         else:
-            self.window_dropdown.configure(values=["No windows found"])
-            self.window_dropdown.set("No windows found")
-            self.window_list = []
+            window_names = ["No windows found"]
+        
+        self._last_window_values = self._set_dropdown_values(
+            self.window_dropdown, self._last_window_values, window_names
+        )
+        if self.window_dropdown.get() != window_names[0]:
+            self.window_dropdown.set(window_names[0])
     
     def add_key(self):
         """Add a new key configuration"""
@@ -785,7 +1004,12 @@ class MainWindow(ctk.CTk):
             key = key.strip().lower()
             if key not in self.current_setup.keys:
                 self.current_setup.keys[key] = KeyConfig()
-                self.update_key_widgets()
+                if len(self.current_setup.keys) == 1:
+                    # Replace the "no keys" placeholder
+                    self.update_key_widgets()
+                else:
+                    # Only build the new row
+                    self.create_key_widget(key, self.current_setup.keys[key])
             else:
                 messagebox.showwarning("Duplicate Key", f"Key '{key}' already exists")
     
@@ -793,35 +1017,82 @@ class MainWindow(ctk.CTk):
         """Remove a key configuration"""
         if key in self.current_setup.keys:
             del self.current_setup.keys[key]
-            self.update_key_widgets()
+            self.key_widgets.pop(key, None)
+            
+            # Hide the row and keep it for reuse
+            row = self._key_rows.pop(key, None)
+            if row is not None:
+                row.frame.pack_forget()
+                self._key_row_pool.append(row)
+                for entry in (row.hold_entry, row.repeat_entry, row.wait_entry):
+                    self._all_key_widgets.remove(entry)
+            
+            if not self.current_setup.keys:
+                # Last key removed, show the placeholder again
+                self.update_key_widgets()
     
     def update_key_widgets(self):
         """Update the key configuration widgets"""
-        # Clear existing widgets
-        for widget in self.keys_scroll_frame.winfo_children():
-            widget.destroy()
+        # Return every row to the pool instead of destroying it
+        for row in self._key_rows.values():
+            row.frame.pack_forget()
+            self._key_row_pool.append(row)
+        self._key_rows.clear()
         self.key_widgets.clear()
+        self._all_key_widgets.clear()
         
         if not self.current_setup.keys:
             # Show placeholder when no keys
-            placeholder = ctk.CTkLabel(
-                self.keys_scroll_frame,
-                text="No keys configured. Click '+ Add Key' to get started.",
-                font=("Helvetica", 12),
-                text_color="#6B7280"
-            )
-            placeholder.pack(pady=20)
+            if self._keys_placeholder is None:
+                self._keys_placeholder = ctk.CTkLabel(
+                    self.keys_scroll_frame,
+                    text="No keys configured. Click '+ Add Key' to get started.",
+                    font=FONT_MD,
+                    text_color=COLOR_MUTED
+                )
+                self._add_wheel_tag(self._keys_placeholder)
+            self._keys_placeholder.pack(pady=20)
             return
         
+        if self._keys_placeholder is not None:
+            self._keys_placeholder.pack_forget()
+        
         # Create widgets for each key
         for key_name, key_config in self.current_setup.keys.items():
             self.create_key_widget(key_name, key_config)
     
     def create_key_widget(self, key_name: str, key_config: KeyConfig):
-        """Create a widget for configuring a single key"""
+        """Show a row for configuring a single key, reusing a pooled row if possible"""
+        row = self._key_row_pool.pop() if self._key_row_pool else self._build_key_row()
+        
+        # Point the row at this key
+        row.key_label.configure(text=f"Key: {key_name.upper()}")
+        row.remove_btn.configure(command=lambda k=key_name: self.remove_key(k), state="normal")
+        self._fill_key_row(row, key_config)
+        
+        row.frame.pack(fill="x", padx=10, pady=5)
+        
+        # Store widget references for value retrieval
+        self._key_rows[key_name] = row
+        self.key_widgets[key_name] = {
+            'hold': row.hold_entry,
+            'repeat': row.repeat_entry,
+            'wait': row.wait_entry
+        }
+        self._all_key_widgets.extend((row.hold_entry, row.repeat_entry, row.wait_entry))
+    
+    def _fill_key_row(self, row: KeyRow, key_config: KeyConfig):
+        """Show a key's values in the entries of its row"""
+        for entry, text in zip((row.hold_entry, row.repeat_entry, row.wait_entry),
+                               key_config.as_strings()):
+            entry.configure(state="normal")
+            entry.delete(0, "end")
+            entry.insert(0, text)
+    
+    def _build_key_row(self) -> KeyRow:
+        """Create the widgets for one key configuration row"""
         # Main frame for this key
         key_frame = ctk.CTkFrame(self.keys_scroll_frame)
-        key_frame.pack(fill="x", padx=10, pady=5)
         
         # Header with key name and remove button
         header_frame = ctk.CTkFrame(key_frame, fg_color="transparent")
@@ -829,20 +1100,19 @@ class MainWindow(ctk.CTk):
         
         key_label = ctk.CTkLabel(
             header_frame,
-            text=f"Key: {key_name.upper()}",
-            font=("Helvetica", 14, "bold")
+            text="",
+            font=FONT_LG_B
         )
         key_label.pack(side="left")
         
         remove_btn = ctk.CTkButton(
             header_frame,
             text="✖ Remove",
-            command=lambda k=key_name: self.remove_key(k),
             width=80,
             height=25,
-            font=("Helvetica", 10),
-            fg_color="#EF4444",
-            hover_color="#DC2626"
+            font=FONT_XS,
+            fg_color=COLOR_DANGER,
+            hover_color=COLOR_DANGER_HOVER
         )
         remove_btn.pack(side="right")
         
@@ -850,43 +1120,27 @@ class MainWindow(ctk.CTk):
         config_frame = ctk.CTkFrame(key_frame, fg_color="transparent")
         config_frame.pack(fill="x", padx=15, pady=(0, 15))
         
-        # Hold time
-        hold_frame = ctk.CTkFrame(config_frame, fg_color="transparent")
-        hold_frame.pack(side="left", padx=(0, 20))
-        
-        ctk.CTkLabel(hold_frame, text="Hold Time:", font=("Helvetica", 11)).pack()
-        hold_entry = ctk.CTkEntry(hold_frame, width=80, height=25)
-        hold_entry.pack(pady=(2, 0))
-        hold_entry.insert(0, str(key_config.hold))
-        
-        # Repeat count
-        repeat_frame = ctk.CTkFrame(config_frame, fg_color="transparent")
-        repeat_frame.pack(side="left", padx=(0, 20))
-        
-        ctk.CTkLabel(repeat_frame, text="Repeat:", font=("Helvetica", 11)).pack()
-        repeat_entry = ctk.CTkEntry(repeat_frame, width=80, height=25)
-        repeat_entry.pack(pady=(2, 0))
-        repeat_entry.insert(0, str(key_config.repeat))
-        
-        # Wait time
-        wait_frame = ctk.CTkFrame(config_frame, fg_color="transparent")
-        wait_frame.pack(side="left")
-        
-        ctk.CTkLabel(wait_frame, text="Wait After:", font=("Helvetica", 11)).pack()
-        wait_entry = ctk.CTkEntry(wait_frame, width=80, height=25)
-        wait_entry.pack(pady=(2, 0))
-        wait_entry.insert(0, str(key_config.wait))
-        
-        # Store widget references for value retrieval
-        self.key_widgets[key_name] = {
-            'hold': hold_entry,
-            'repeat': repeat_entry,
-            'wait': wait_entry
-        }
+        # Hold time, repeat count and wait time
+        hold_entry = _labeled_entry(config_frame, "Hold Time:", 80)
+        repeat_entry = _labeled_entry(config_frame, "Repeat:", 80)
+        wait_entry = _labeled_entry(config_frame, "Wait After:", 80, padx=0)
+        
+        # Built once per pooled row, so tagging the whole tree here is cheap
+        self._add_wheel_tag(key_frame)
+        
+        return KeyRow(
+            frame=key_frame,
+            key_label=key_label,
+            remove_btn=remove_btn,
+            hold_entry=hold_entry,
+            repeat_entry=repeat_entry,
+            wait_entry=wait_entry
+        )
     
     def get_current_setup_from_ui(self) -> Setup:
-        """Extract current setup configuration from UI"""
-        setup = Setup(name=self.current_setup.name)
+        """Extract current setup configuration from UI into the current setup"""
+        # Update the live setup instead of building a new one each call
+        setup = self.current_setup
         
         # Get interval with parsing
         interval_text = self.interval_entry.get().strip() or "5s"
@@ -901,67 +1155,31 @@ class MainWindow(ctk.CTk):
         setup.keybind = self.current_keybind
         
         # Get window info
-        selected_value = self.window_dropdown.get()
-        if selected_value != "No windows found" and hasattr(self, 'window_list'):
-            for i, window_name in enumerate([f"{w['title']} ({w['class']})" for w in self.window_list]):
-                if window_name == selected_value:
-                    setup.window_id = self.window_list[i]['id']
-                    setup.window_title = self.window_list[i]['title']
-                    break
+        window = self._window_by_display.get(sys.intern(self.window_dropdown.get()))
+        if window:
+            setup.window_id = window['id']
+            setup.window_title = window['title']
+        else:
+            setup.window_id = ""
+            setup.window_title = ""
+        
+        # Drop keys that no longer have widgets
+        if setup.keys.keys() != self.key_widgets.keys():
+            setup.keys = {name: setup.keys.get(name) or KeyConfig() for name in self.key_widgets}
         
         # Get key configurations from widgets
         for key_name, widgets in self.key_widgets.items():
-            try:
-                hold_time = float(widgets['hold'].get() or "0.1")
-                repeat_count = int(widgets['repeat'].get() or "1")
-                wait_time = float(widgets['wait'].get() or "0")
-                
-                setup.keys[key_name] = KeyConfig(
-                    hold=hold_time,
-                    repeat=repeat_count,
-                    wait=wait_time
-                )
-            except ValueError:
-                # Use defaults for invalid values
-                setup.keys[key_name] = KeyConfig()
+            key_config = setup.keys[key_name]
+            key_config.hold, key_config.repeat, key_config.wait = _parse_key_row(
+                widgets['hold'].get(), widgets['repeat'].get(), widgets['wait'].get()
+            )
         
         return setup
     
     def parse_interval(self, interval_text: str) -> float:
         """Parse interval text to seconds - supports compound formats like 2h,30m,15s"""
-        interval_text = interval_text.strip().lower()
-        
-        # Handle compound formats (comma-separated)
-        if ',' in interval_text:
-            parts = [part.strip() for part in interval_text.split(',')]
-            total_seconds = 0.0
-            
-            for part in parts:
-                if not part:
-                    continue
-                    
-                if part.endswith('s'):
-                    total_seconds += float(part[:-1])
-                elif part.endswith('m'):
-                    total_seconds += float(part[:-1]) * 60
-                elif part.endswith('h'):
-                    total_seconds += float(part[:-1]) * 3600
-                else:
-                    # Assume seconds if no unit
-                    total_seconds += float(part)
-            
-            return total_seconds
-        
-        # Handle single format
-        if interval_text.endswith('s'):
-            return float(interval_text[:-1])
-        elif interval_text.endswith('m'):
-            return float(interval_text[:-1]) * 60
-        elif interval_text.endswith('h'):
-            return float(interval_text[:-1]) * 3600
-        else:
-            # Assume seconds if no unit
-            return float(interval_text)
+        # Memoized per distinct text by the config manager
+        return self.config_manager.display_to_seconds(interval_text.strip())
     
     def load_setup_to_ui(self, setup: Setup):
         """Load a setup configuration into the UI"""
@@ -970,6 +1188,7 @@ class MainWindow(ctk.CTk):
         # Update interval with display format
         self.interval_entry.delete(0, "end")
         self.interval_entry.insert(0, setup.interval_display)
+        self.check_interval_entry()
         
         # Update keybind if different from current
         if setup.keybind != self.current_keybind:
@@ -977,12 +1196,14 @@ class MainWindow(ctk.CTk):
             self.update_keybind()
         
         # Select matching window if available
-        if setup.window_title and hasattr(self, 'window_list'):
-            for window in self.window_list:
-                if window['title'] == setup.window_title:
-                    window_name = f"{window['title']} ({window['class']})"
-                    self.window_dropdown.set(window_name)
-                    break
+        if setup.window_title in self._display_by_title and setup.window_title:
+            self.window_dropdown.set(self._display_by_title[setup.window_title])
+        
+        # Same keys in the same order, only the values need updating
+        if setup.keys and list(setup.keys) == list(self._key_rows):
+            for key_name, key_config in setup.keys.items():
+                self._fill_key_row(self._key_rows[key_name], key_config)
+            return
         
         # Update key widgets
         self.update_key_widgets()
@@ -999,12 +1220,14 @@ class MainWindow(ctk.CTk):
         if selected == "No setups found" or not selected:
             return
         
-        setup = self.config_manager.load_setup(selected)
-        if setup:
-            self.load_setup_to_ui(setup)
-            messagebox.showinfo("Success", f"Loaded setup '{selected}'")
-        else:
-            messagebox.showerror("Error", f"Failed to load setup '{selected}'")
+        def done(setup):
+            if setup:
+                self.load_setup_to_ui(setup)
+                messagebox.showinfo("Success", f"Loaded setup '{selected}'")
+            else:
+                messagebox.showerror("Error", f"Failed to load setup '{selected}'")
+        
+        self._run_config_io(lambda: self.config_manager.load_setup(selected), done)
     
     def save_setup(self):
         """Save the current configuration as a setup"""
@@ -1014,22 +1237,30 @@ class MainWindow(ctk.CTk):
             messagebox.showerror("Error", "Please enter a setup name in the dropdown")
             return
         
-        # Check if setup exists
-        if self.config_manager.setup_exists(name):
-            if not messagebox.askyesno("Overwrite", f"Setup '{name}' already exists. Overwrite?"):
-                return
-        
         # Get current configuration
         setup = self.get_current_setup_from_ui()
-        setup.name = name
         
-        # Save setup
-        if self.config_manager.save_setup(setup):
-            messagebox.showinfo("Success", f"Saved setup '{name}'")
-            self.refresh_setups()
-            self.setup_dropdown.set(name)
-        else:
-            messagebox.showerror("Error", f"Failed to save setup '{name}'")
+        def saved_done(saved):
+            if saved:
+                messagebox.showinfo("Success", f"Saved setup '{name}'")
+                self.refresh_setups()
+                self.setup_dropdown.set(name)
+            else:
+                messagebox.showerror("Error", f"Failed to save setup '{name}'")
+        
+        def exists_done(exists):
+            # Check if setup exists
+            if exists:
+                if not messagebox.askyesno("Overwrite", f"Setup '{name}' already exists. Overwrite?"):
+                    return
+            
+            # Name the setup only once the save is confirmed, and hand the
+            # worker a copy so later UI edits can't change it mid-save
+            setup.name = name
+            snapshot = copy.deepcopy(setup)
+            self._run_config_io(lambda: self.config_manager.save_setup(snapshot), saved_done)
+        
+        self._run_config_io(lambda: self.config_manager.setup_exists(name), exists_done)
     
     def delete_setup(self):
         """Delete the selected setup"""
@@ -1039,14 +1270,17 @@ class MainWindow(ctk.CTk):
             return
         
         if messagebox.askyesno("Delete Setup", f"Delete setup '{selected}'? This cannot be undone."):
-            if self.config_manager.delete_setup(selected):
-                messagebox.showinfo("Success", f"Deleted setup '{selected}'")
-                self.refresh_setups()
-                # Reset to empty setup
-                self.current_setup = Setup(name="")
-                self.update_key_widgets()
-            else:
-                messagebox.showerror("Error", f"Failed to delete setup '{selected}'")
+            def done(deleted):
+                if deleted:
+                    messagebox.showinfo("Success", f"Deleted setup '{selected}'")
+                    self.refresh_setups()
+                    # Reset to empty setup
+                    self.current_setup = Setup(name="")
+                    self.update_key_widgets()
+                else:
+                    messagebox.showerror("Error", f"Failed to delete setup '{selected}'")
+            
+            self._run_config_io(lambda: self.config_manager.delete_setup(selected), done)
     
     def toggle_active(self):
         """Toggle the input sender on/off"""
@@ -1066,9 +1300,9 @@ class MainWindow(ctk.CTk):
                 messagebox.showerror("Error", "Please add at least one key configuration")
                 return
             
-            # Start enhanced scheduler
+            # Start enhanced scheduler on a snapshot, the UI keeps editing the live setup
             self.run_count = 0  # Reset counter
-            self.scheduler = EnhancedScheduler(self.input_sender, current_setup, self.on_run_cycle)
+            self.scheduler = EnhancedScheduler(self.input_sender, copy.deepcopy(current_setup), self.on_run_cycle)
             self.scheduler.start()
             
             self.is_active = True
@@ -1084,13 +1318,70 @@ class MainWindow(ctk.CTk):
             self.update_ui_state()
     
     def on_run_cycle(self):
-        """Callback when a run cycle completes"""
+        """Callback when a run cycle completes, called from the scheduler thread"""
+        self._ui(self._update_counter)
+    
+    def _update_counter(self):
+        """Count a completed run cycle and show it"""
         self.run_count += 1
+        if not self.is_active or self._counter_after_id is not None:
+            return
+        
+        # Redraw at most every 100ms, fast schedules show the latest count
+        delay = int((self._last_counter_update + 0.1 - time.perf_counter()) * 1000)
+        if delay > 0:
+            self._counter_after_id = self.after(delay, self._show_counter)
+        else:
+            self._show_counter()
+    
+    def _show_counter(self):
+        """Show the current run count"""
+        self._counter_after_id = None
+        self._last_counter_update = time.perf_counter()
         if self.is_active:
-            # Update the status labels with new count
-            self.status_main_label.configure(text="● ACTIVE")
+            # update_ui_state already shows "● ACTIVE", only the count changes
             self.status_counter_label.configure(text=f"({self.run_count})")
     
+    def on_interval_typed(self, event):
+        """Re-check the interval entry once the user pauses typing"""
+        if self._interval_check_after_id is not None:
+            self.after_cancel(self._interval_check_after_id)
+        self._interval_check_after_id = self.after(150, self.check_interval_entry)
+    
+    def check_interval_entry(self):
+        """Grey out the toggle button and show why while the interval entry is invalid"""
+        if self._interval_check_after_id is not None:
+            self.after_cancel(self._interval_check_after_id)
+            self._interval_check_after_id = None
+        
+        if self.is_active:
+            return
+        
+        interval_text = self.interval_entry.get().strip()
+        interval = self.config_manager.parse_duration(interval_text)
+        if not interval_text:
+            error = "Enter an interval"
+        elif interval is None:
+            error = "Invalid format"
+        elif interval <= 0:
+            error = "Must be positive"
+        else:
+            error = None
+        
+        self.toggle_button.configure(state="disabled" if error else "normal")
+        
+        # Only redraw the hint when the reason changes
+        if error == self._interval_error:
+            return
+        self._interval_error = error
+        
+        if error:
+            self.interval_entry.configure(border_color=COLOR_DANGER)
+            self.interval_help.configure(text=f"{error}. Examples: {INTERVAL_EXAMPLES}", text_color=COLOR_DANGER)
+        else:
+            self.interval_entry.configure(border_color=self._interval_border_color)
+            self.interval_help.configure(text=f"Examples: {INTERVAL_EXAMPLES}", text_color=COLOR_MUTED)
+    
     def validate_inputs(self) -> bool:
         """Validate user inputs"""
         # Check interval
@@ -1099,12 +1390,14 @@ class MainWindow(ctk.CTk):
             messagebox.showerror("Error", "Please enter an interval")
             return False
         
-        try:
-            interval = self.parse_interval(interval_text)
-            if interval <= 0:
-                raise ValueError("Interval must be positive")
-        except ValueError as e:
-            messagebox.showerror("Error", f"Invalid interval format. Use examples: 5s, 2m,30s, 1h,15m,30s\n\nError: {str(e)}")
+        # Validate and parse in one scan, without raising on malformed text
+        interval = self.config_manager.parse_duration(interval_text)
+        if interval is None:
+            messagebox.showerror("Error", f"Invalid interval format. Use examples: {INTERVAL_EXAMPLES}")
+            return False
+        
+        if interval <= 0:
+            messagebox.showerror("Error", f"Invalid interval format. Use examples: {INTERVAL_EXAMPLES}\n\nError: Interval must be positive")
             return False
         
         return True
@@ -1112,47 +1405,42 @@ class MainWindow(ctk.CTk):
     def update_ui_state(self):
         """Update UI elements based on active state"""
         if self.is_active:
-            self.status_main_label.configure(
-                text="● ACTIVE",
-                text_color="#10B981"
-            )
-            if self.run_count > 0:
-                self.status_counter_label.configure(text=f"({self.run_count})")
-            else:
-                self.status_counter_label.configure(text="")
-            self.toggle_button.configure(
-                text=f"DEACTIVATE ({self.current_keybind})",
-                fg_color="#EF4444",
-                hover_color="#DC2626"
-            )
+            self.status_main_label.configure(**self._ACTIVE_STATUS)
+            self.status_counter_label.configure(text=f"({self.run_count})" if self.run_count > 0 else "")
+            self.toggle_button.configure(text=self._active_label, **self._TOGGLE_ACTIVE)
             # Disable inputs while active
             self.window_dropdown.configure(state="disabled")
             self.interval_entry.configure(state="disabled")
             # Disable key widgets
-            for widgets in self.key_widgets.values():
-                for widget in widgets.values():
-                    widget.configure(state="disabled")
+            self.add_key_btn.configure(state="disabled")
+            for widget in self._all_key_widgets:
+                widget.configure(state="disabled")
+            for row in self._key_rows.values():
+                row.remove_btn.configure(state="disabled")
         else:
-            self.status_main_label.configure(
-                text="● INACTIVE",
-                text_color="#EF4444"
-            )
+            self.status_main_label.configure(**self._INACTIVE_STATUS)
             self.status_counter_label.configure(text="")
-            self.toggle_button.configure(
-                text=f"ACTIVATE ({self.current_keybind})",
-                fg_color="#2563EB",
-                hover_color="#1E40AF"
-            )
+            self.toggle_button.configure(text=self._inactive_label, **self._TOGGLE_INACTIVE)
             # Enable inputs
             self.window_dropdown.configure(state="readonly")
             self.interval_entry.configure(state="normal")
             # Enable key widgets
-            for widgets in self.key_widgets.values():
-                for widget in widgets.values():
-                    widget.configure(state="normal")
+            self.add_key_btn.configure(state="normal")
+            for widget in self._all_key_widgets:
+                widget.configure(state="normal")
+            for row in self._key_rows.values():
+                row.remove_btn.configure(state="normal")
     
     def destroy(self):
         """Clean up before closing"""
-        if self.scheduler:
-            self.scheduler.stop()
+        if self._interval_check_after_id is not None:
+            self.after_cancel(self._interval_check_after_id)
+        self.after_cancel(self._ui_poll_after_id)
+        # A cycle still running after the join timeout may be inside libxdo,
+        # leave freeing its context to process exit
+        if self.scheduler is None or self.scheduler.stop():
+            self.input_sender.close()
+        self._io_executor.shutdown(wait=False)
+        if self._capture_window is not None:
+            self._capture_window.destroy()
         super().destroy()
@@ -3,22 +3,134 @@
 import customtkinter as ctk
 from PIL import Image
 import tkinter as tk
+import hashlib
+import io
 import os
+import queue
 import sys
-import threading
+import tempfile
 import time
 
+try:
+    from platformdirs import user_cache_dir
+except ImportError:  # optional, the banner is resized on every launch
+    user_cache_dir = None
+
+
+# Splash window size
+SPLASH_WIDTH = 400
+SPLASH_HEIGHT = 300
+
+# Space for the banner inside the splash window
+BANNER_WIDTH = 380
+BANNER_HEIGHT = 280
+
+
+def splash_geometry(screen_width, screen_height):
+    """Get the geometry string that centers the splash on a screen"""
+    x = (screen_width - SPLASH_WIDTH) // 2
+    y = (screen_height - SPLASH_HEIGHT) // 2
+    return f"{SPLASH_WIDTH}x{SPLASH_HEIGHT}+{x}+{y}"
+
+
+def banner_path():
+    """Get the path to the banner image with proper PyInstaller support"""
+    if hasattr(sys, '_MEIPASS'):
+        # Running as PyInstaller executable
+        return os.path.join(sys._MEIPASS, "gui", "assets", "banner.png")
+    # Running as Python script
+    return os.path.join(os.path.dirname(__file__), "assets", "banner.png")
+
+
+def load_banner_image():
+    """Decode and resize the banner with PIL, or None if that fails; safe off the Tk thread"""
+    assets_path = banner_path()
+    print(f"Looking for banner at: {assets_path}")
+    
+    try:
+        # Load the image using PIL
+        with open(assets_path, 'rb') as f:
+            banner_data = f.read()
+        banner_image = Image.open(io.BytesIO(banner_data))
+        
+        # Calculate scaling to fit within window while maintaining aspect ratio
+        img_ratio = banner_image.width / banner_image.height
+        window_ratio = BANNER_WIDTH / BANNER_HEIGHT
+        
+        if img_ratio > window_ratio:
+            # Image is wider than window ratio
+            new_width = BANNER_WIDTH
+            new_height = int(BANNER_WIDTH / img_ratio)
+        else:
+            # Image is taller than window ratio
+            new_height = BANNER_HEIGHT
+            new_width = int(BANNER_HEIGHT * img_ratio)
+        
+        return load_resized_banner(banner_image, banner_data, new_width, new_height)
+        
+    except Exception as pil_error:
+        print(f"PIL banner failed: {pil_error}")
+        return None
+
+
+def load_resized_banner(banner_image, banner_data, width, height):
+    """Resize the banner, reusing the result of an earlier launch if cached"""
+    if user_cache_dir is None:
+        return banner_image.resize((width, height), Image.Resampling.LANCZOS)
+    
+    # Keyed on content, PyInstaller extracts files with fresh mtimes each run
+    digest = hashlib.blake2b(banner_data, digest_size=8).hexdigest()
+    # Per-user cache dir, a fixed name in the shared temp dir could be planted
+    cache_dir = user_cache_dir("specifinput")
+    cache_path = os.path.join(cache_dir, f"banner_{width}x{height}_{digest}.png")
+    
+    try:
+        cached_image = Image.open(cache_path)
+        cached_image.load()
+        return cached_image
+    except (OSError, ValueError):
+        pass  # Not cached yet (or unreadable), resize below
+    
+    banner_image = banner_image.resize((width, height), Image.Resampling.LANCZOS)
+    
+    # Write to a temporary file and rename it, so a concurrent launch never
+    # reads a partial image
+    tmp_path = None
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=cache_dir, suffix=".png", delete=False) as f:
+            tmp_path = f.name
+            banner_image.save(f, format="PNG", optimize=True)
+        os.replace(tmp_path, cache_path)
+    except (OSError, ValueError) as e:
+        print(f"Could not cache banner: {e}")
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+    
+    return banner_image
+
 
 class SplashScreen(ctk.CTkToplevel):
     """Splash screen that displays banner and fades out"""
     
-    def __init__(self, parent=None, callback=None):
+    def __init__(self, parent=None, callback=None, banner_queue=None, geometry=None):
         super().__init__(parent)
         
         self.callback = callback
+        # Precomputed splash_geometry() result, if given
+        self.window_geometry = geometry
+        # Delivers the result of load_banner_image from a loader thread, if given
+        self.banner_queue = banner_queue
+        self.text_banner_labels = []
         self.alpha = 1.0
-        self.fade_step = 0.05
-        self.fade_delay = 50  # milliseconds
+        self.fade_duration = 0.3  # seconds, regardless of scheduler jitter
+        self.fade_delay = 40  # milliseconds between frames
+        self.fade_start = None
+        # Skip the initial hold, e.g. for repeat launches
+        self.hold_delay = 0 if os.environ.get("SPECIFINPUT_FAST_SPLASH") else 2000  # milliseconds
         self.is_closing = False
         self.pending_callbacks = []  # Track scheduled callbacks
         
@@ -29,7 +141,7 @@ class SplashScreen(ctk.CTkToplevel):
         self.setup_banner()
         
         # Start fade-out timer
-        callback_id = self.after(2000, self.start_fade_out)
+        callback_id = self.after(self.hold_delay, self.start_fade_out)
         self.pending_callbacks.append(callback_id)
     
     def setup_window(self):
@@ -38,15 +150,9 @@ class SplashScreen(ctk.CTkToplevel):
         self.overrideredirect(True)
         
         # Set window size and center it
-        window_width = 400
-        window_height = 300
-        screen_width = self.winfo_screenwidth()
-        screen_height = self.winfo_screenheight()
-        
-        x = (screen_width - window_width) // 2
-        y = (screen_height - window_height) // 2
-        
-        self.geometry(f"{window_width}x{window_height}+{x}+{y}")
+        if self.window_geometry is None:
+            self.window_geometry = splash_geometry(self.winfo_screenwidth(), self.winfo_screenheight())
+        self.geometry(self.window_geometry)
         
         # Set background color
         self.configure(fg_color="#1a1a1a")
@@ -59,56 +165,85 @@ class SplashScreen(ctk.CTkToplevel):
     
     def setup_banner(self):
         """Load and display the banner image"""
+        if self.banner_queue is not None:
+            # Decoded on another thread, show the text banner until it arrives
+            self.show_text_banner()
+            self.try_install_banner()
+            return
+        
+        self.install_banner(load_banner_image())
+    
+    def try_install_banner(self):
+        """Install the preloaded banner once the loader thread delivers it"""
+        if self.is_closing:
+            return
+        
         try:
-            # Get the path to the banner image with proper PyInstaller support
-            if hasattr(sys, '_MEIPASS'):
-                # Running as PyInstaller executable
-                assets_path = os.path.join(sys._MEIPASS, "gui", "assets", "banner.png")
-            else:
-                # Running as Python script
-                assets_path = os.path.join(os.path.dirname(__file__), "assets", "banner.png")
-            
-            print(f"Looking for banner at: {assets_path}")
-            print(f"Banner exists: {os.path.exists(assets_path)}")
+            banner_image = self.banner_queue.get_nowait()
+        except queue.Empty:
+            callback_id = self.after(20, self.try_install_banner)
+            self.pending_callbacks.append(callback_id)
+            return
+        
+        # Replace the text banner
+        for label in self.text_banner_labels:
+            label.destroy()
+        self.text_banner_labels = []
+        self.install_banner(banner_image)
+    
+    def install_banner(self, banner_image):
+        """Display a banner image loaded by load_banner_image, or fall back if loading failed"""
+        try:
+            if banner_image is not None:
+                # Convert to CTkImage for better compatibility
+                self.banner_photo = ctk.CTkImage(
+                    light_image=banner_image,
+                    dark_image=banner_image,
+                    size=banner_image.size
+                )
+                
+                # Create label to display image
+                self.banner_label = ctk.CTkLabel(
+                    self,
+                    image=self.banner_photo,
+                    text=""
+                )
+                self.banner_label.place(
+                    relx=0.5, 
+                    rely=0.5, 
+                    anchor="center"
+                )
+                
+                print("Banner image loaded successfully with PIL!")
+                return
             
+            assets_path = banner_path()
             if os.path.exists(assets_path):
+                # Try tkinter PhotoImage fallback with better scaling
                 try:
-                    # Try PIL approach first
-                    from PIL import Image
-                    
-                    # Load the image using PIL
-                    banner_image = Image.open(assets_path)
+                    # Load original image to get dimensions
+                    banner_photo = tk.PhotoImage(file=assets_path)
+                    img_width = banner_photo.width()
+                    img_height = banner_photo.height()
                     
-                    # Resize image to fit window while maintaining aspect ratio
-                    window_width = 380
-                    window_height = 280
+                    print(f"Original banner size: {img_width}x{img_height}")
                     
-                    # Calculate scaling to fit within window
-                    img_ratio = banner_image.width / banner_image.height
-                    window_ratio = window_width / window_height
+                    # Calculate how much we need to scale down
+                    scale_x = img_width / BANNER_WIDTH
+                    scale_y = img_height / BANNER_HEIGHT
+                    max_scale = max(scale_x, scale_y)
                     
-                    if img_ratio > window_ratio:
-                        # Image is wider than window ratio
-                        new_width = window_width
-                        new_height = int(window_width / img_ratio)
-                    else:
-                        # Image is taller than window ratio
-                        new_height = window_height
-                        new_width = int(window_height * img_ratio)
-                    
-                    banner_image = banner_image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                    
-                    # Convert to CTkImage for better compatibility
-                    self.banner_photo = ctk.CTkImage(
-                        light_image=banner_image,
-                        dark_image=banner_image,
-                        size=(new_width, new_height)
-                    )
+                    # Use subsample (must be integer >= 1)
+                    if max_scale > 1:
+                        subsample_factor = max(2, int(max_scale))
+                        print(f"Subsampling by factor: {subsample_factor}")
+                        banner_photo = banner_photo.subsample(subsample_factor, subsample_factor)
+                        print(f"New banner size: {banner_photo.width()}x{banner_photo.height()}")
                     
                     # Create label to display image
                     self.banner_label = ctk.CTkLabel(
                         self,
-                        image=self.banner_photo,
+                        image=banner_photo,
                         text=""
                     )
                     self.banner_label.place(
@@ -117,59 +252,15 @@ class SplashScreen(ctk.CTkToplevel):
                         anchor="center"
                     )
                     
-                    print("Banner image loaded successfully with PIL!")
+                    # Store reference
+                    self._banner_photo = banner_photo
+                    
+                    print("Banner image loaded successfully with tkinter (resized)!")
                     return
                     
-                except Exception as pil_error:
-                    print(f"PIL banner failed: {pil_error}")
-                    # Try tkinter PhotoImage fallback with better scaling
-                    try:
-                        import tkinter as tk
-                        
-                        # Load original image to get dimensions
-                        banner_photo = tk.PhotoImage(file=assets_path)
-                        img_width = banner_photo.width()
-                        img_height = banner_photo.height()
-                        
-                        print(f"Original banner size: {img_width}x{img_height}")
-                        
-                        # Calculate subsample factor to fit in splash window (380x280)
-                        window_width = 380
-                        window_height = 280
-                        
-                        # Calculate how much we need to scale down
-                        scale_x = img_width / window_width
-                        scale_y = img_height / window_height
-                        max_scale = max(scale_x, scale_y)
-                        
-                        # Use subsample (must be integer >= 1)
-                        if max_scale > 1:
-                            subsample_factor = max(2, int(max_scale))
-                            print(f"Subsampling by factor: {subsample_factor}")
-                            banner_photo = banner_photo.subsample(subsample_factor, subsample_factor)
-                            print(f"New banner size: {banner_photo.width()}x{banner_photo.height()}")
-                        
-                        # Create label to display image
-                        self.banner_label = ctk.CTkLabel(
-                            self,
-                            image=banner_photo,
-                            text=""
-                        )
-                        self.banner_label.place(
-                            relx=0.5, 
-                            rely=0.5, 
-                            anchor="center"
-                        )
-                        
-                        # Store reference
-                        self._banner_photo = banner_photo
-                        
-                        print("Banner image loaded successfully with tkinter (resized)!")
-                        return
-                        
-                    except Exception as tk_error:
-                        print(f"Tkinter banner also failed: {tk_error}")
-                
+                except Exception as tk_error:
+                    print(f"Tkinter banner also failed: {tk_error}")
+            
             # If we get here, show text fallback
             print("Using text fallback for banner")
             self.show_text_banner()
@@ -181,6 +272,9 @@ class SplashScreen(ctk.CTkToplevel):
     
     def show_text_banner(self):
         """Show text-based banner"""
+        if self.text_banner_labels:
+            return
+        
         # Main title
         self.banner_label = ctk.CTkLabel(
             self,
@@ -219,10 +313,13 @@ class SplashScreen(ctk.CTkToplevel):
             rely=0.7, 
             anchor="center"
         )
+        
+        self.text_banner_labels = [self.banner_label, subtitle_label, info_label]
     
     def start_fade_out(self):
         """Begin the fade-out animation"""
         if not self.is_closing:
+            self.fade_start = time.perf_counter()
             self.fade_out()
     
     def fade_out(self):
@@ -231,9 +328,9 @@ class SplashScreen(ctk.CTkToplevel):
             return
             
         if self.alpha > 0:
-            self.alpha -= self.fade_step
-            if self.alpha < 0:
-                self.alpha = 0
+            # Alpha follows wall time, so late frames don't stretch the fade
+            elapsed = time.perf_counter() - self.fade_start
+            self.alpha = max(0.0, 1.0 - elapsed / self.fade_duration)
             
             try:
                 self.attributes("-alpha", self.alpha)
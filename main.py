@@ -6,9 +6,9 @@ Main application entry point
 
 import customtkinter as ctk
 from gui.main_window import MainWindow
-from gui.splash_screen import SplashScreen
+from gui.splash_screen import SplashScreen, load_banner_image, splash_geometry
+import queue
 import threading
-import time
 
 
 class App:
@@ -17,18 +17,43 @@ class App:
     def __init__(self):
         self.main_window = None
         self.splash = None
+        self._splash_geometry = None
+        
+        # Decode the splash banner while the windows are being created
+        self._banner_queue = queue.Queue(maxsize=1)
+        threading.Thread(target=self._preload_banner, daemon=True).start()
+    
+    def _preload_banner(self):
+        """Load the splash banner on a background thread"""
+        self._banner_queue.put(load_banner_image())
     
     def run(self):
         """Run the application with splash screen"""
         # Set appearance mode and color theme
         ctk.set_appearance_mode("dark")
-        ctk.set_default_color_theme("blue")
+        # The "blue" color theme is loaded by customtkinter on import already
         
-        # Create main window hidden initially
-        self.main_window = MainWindow(start_hidden=True)
+        # Create main window hidden initially, its widgets are built below
+        self.main_window = MainWindow(start_hidden=True, defer_setup=True)
+        
+        # Center the splash once, later splashes reuse the geometry
+        if self._splash_geometry is None:
+            self._splash_geometry = splash_geometry(
+                self.main_window.winfo_screenwidth(),
+                self.main_window.winfo_screenheight()
+            )
         
         # Create and show splash screen
-        self.splash = SplashScreen(self.main_window, callback=self.show_main_window)
+        self.splash = SplashScreen(
+            self.main_window,
+            callback=self.show_main_window,
+            banner_queue=self._banner_queue,
+            geometry=self._splash_geometry
+        )
+        
+        # Paint the splash first, then build the main window behind it
+        self.splash.update_idletasks()
+        self.main_window.after_idle(self.main_window.finish_setup)
         
         # Start the main loop
         self.main_window.mainloop()
@@ -41,6 +66,8 @@ class App:
         
         # Show main window
         if self.main_window:
+            # Normally built during the splash already
+            self.main_window.finish_setup()
             self.main_window.deiconify()
             self.main_window.lift()
             self.main_window.focus_force()
@@ -0,0 +1,58 @@
+"""Tests for the interval duration grammar in ConfigManager"""
+
+import tempfile
+import unittest
+
+from core.config_manager import ConfigManager
+
+
+class DurationGrammarTest(unittest.TestCase):
+    """Pin which interval strings are accepted and what they parse to"""
+    
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.config_manager = ConfigManager(self.tmp_dir.name)
+    
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+    
+    def test_accepted_durations(self):
+        cases = {
+            "5": 5.0,
+            "5s": 5.0,
+            "5 s": 5.0,
+            " 2H ": 7200.0,
+            "1.5m": 90.0,
+            ".5s": 0.5,
+            "5.": 5.0,
+            "1e3": 1000.0,
+            "2m,30s": 150.0,
+            "1h,15m,30s": 4530.0,
+            "2h, 30m, 15s": 9015.0,
+            "1h,,30s": 3630.0,
+            "5s,": 5.0,
+        }
+        for display, seconds in cases.items():
+            with self.subTest(display=display):
+                self.assertTrue(self.config_manager.is_valid_duration(display))
+                self.assertEqual(self.config_manager.parse_duration(display), seconds)
+                self.assertEqual(self.config_manager.display_to_seconds(display), seconds)
+    
+    def test_rejected_durations(self):
+        for display in ("", " ", ",", "5 5", "2m 30", "1h30m", "5s5", "1.5.2",
+                        "5x", "5ss", "s", "1..5", "1" * 20 + "x"):
+            with self.subTest(display=display):
+                self.assertFalse(self.config_manager.is_valid_duration(display))
+                self.assertIsNone(self.config_manager.parse_duration(display))
+                with self.assertRaises(ValueError):
+                    self.config_manager.display_to_seconds(display)
+    
+    def test_seconds_to_display_round_trip(self):
+        for seconds in (5.0, 90.0, 150.0, 3600.0, 4530.0):
+            with self.subTest(seconds=seconds):
+                display = self.config_manager.seconds_to_display(seconds)
+                self.assertEqual(self.config_manager.display_to_seconds(display), seconds)
+
+
+if __name__ == "__main__":
+    unittest.main()